@@ -4,14 +4,19 @@ This package provides CLI tools for managing the Klondike Spec framework
 artifacts including features.json and agent-progress tracking.
 """
 
-from .cli import app, main
-from .models import Feature, FeatureRegistry, ProgressLog, Session
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 try:
     from ._version import __version__
 except ImportError:
     __version__ = "0.0.0+unknown"
 
+if TYPE_CHECKING:
+    from .cli import app, main
+    from .models import Feature, FeatureRegistry, ProgressLog, Session
+
 __all__ = [
     "Feature",
     "FeatureRegistry",
@@ -21,3 +26,26 @@ __all__ = [
     "main",
     "__version__",
 ]
+
+# Public names resolved on first access, so importing the package (e.g. for
+# the --version fast path in __main__) doesn't build the whole CLI app
+_LAZY_ATTRS = {
+    "app": ".cli",
+    "main": ".cli",
+    "Feature": ".models",
+    "FeatureRegistry": ".models",
+    "ProgressLog": ".models",
+    "Session": ".models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodules on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
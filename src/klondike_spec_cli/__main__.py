@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from .cli import main
+import sys
+
+
+def main() -> None:
+    """Run the klondike CLI, answering a bare --version without loading the app."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        from . import __version__
+
+        sys.stdout.write(f"klondike {__version__}\n")
+        return
+
+    from .cli import main as cli_main
+
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ..templates import substitute_vars
+
 if TYPE_CHECKING:
     from importlib.abc import Traversable
 
@@ -176,9 +178,7 @@ class AgentAdapter(ABC):
                 continue
             try:
                 content = file_path.read_text(encoding="utf-8")
-                for var, value in template_vars.items():
-                    content = content.replace(var, value)
-                file_path.write_text(content, encoding="utf-8")
+                file_path.write_text(substitute_vars(content, template_vars), encoding="utf-8")
             except (OSError, UnicodeDecodeError, UnicodeEncodeError):
                 # Skip files that can't be read/written or have encoding issues
                 # This allows partial success when processing template files
@@ -15,50 +15,11 @@ from pith import Argument, Option, Pith, PithException, echo
 if TYPE_CHECKING:
     pass
 
-from . import formatting
-
 try:
     from ._version import __version__
 except ImportError:
     __version__ = "0.0.0+unknown"
 
-from .commands.admin import (
-    completion_command,
-    config_command,
-    progress_command,
-    validate_command,
-    version_command,
-)
-from .commands.agents_cmd import agents_generate_command
-from .commands.copilot_cmd import (
-    copilot_cleanup_worktrees,
-    copilot_list_worktrees,
-    copilot_start,
-)
-from .commands.features import (
-    feature_add,
-    feature_block,
-    feature_edit,
-    feature_list,
-    feature_prompt,
-    feature_show,
-    feature_start,
-    feature_verify,
-)
-from .commands.init import init_command, upgrade_command
-from .commands.io import export_features_command, import_features_command
-from .commands.mcp_cmd import mcp_config, mcp_install, mcp_serve
-from .commands.release_cmd import release_command
-from .commands.reporting import report_command
-from .commands.serve_cmd import serve_command
-from .commands.sessions import session_end, session_start
-from .data import (
-    load_features,
-    load_progress,
-)
-from .models import (
-    FeatureStatus,
-)
 
 # --- Helper Functions ---
 
@@ -72,6 +33,8 @@ app = Pith(
 
 
 # --- Commands ---
+# Handlers are imported inside each command so an invocation only loads the
+# modules (and their dependencies) that the chosen subcommand needs.
 
 
 @app.command(pith="Initialize a new Klondike project in current directory", priority=10)
@@ -152,6 +115,8 @@ def init(
         feature add - Add features to the registry
         upgrade - Alias for 'init --upgrade'
     """
+    from .commands.init import init_command
+
     init_command(project_name, force, upgrade, skip_github, prd_source, agent)
 
 
@@ -196,6 +161,8 @@ def upgrade(
         init - Initialize or upgrade a project
         status - Check project status
     """
+    from .commands.init import upgrade_command
+
     upgrade_command(skip_github, prd_source, agent)
 
 
@@ -231,6 +198,8 @@ def status(
         feature list - Detailed feature listing
         session start - Begin a new session
     """
+    from .data import load_features, load_progress
+
     registry = load_features()
     progress = load_progress()
 
@@ -250,8 +219,7 @@ def status(
                 else 0
             ),
             "byStatus": {
-                status.value: len(registry.get_features_by_status(status))
-                for status in FeatureStatus
+                status.value: count for status, count in registry.count_by_status().items()
             },
             "currentSession": (current_session.to_dict() if current_session is not None else None),
         }
@@ -260,6 +228,8 @@ def status(
 
     # Text output with rich formatting
     # Use rich console for colored output
+    from . import formatting
+
     console = formatting.get_console()
 
     # Print status summary with colors
@@ -342,6 +312,7 @@ def feature(
     reason: str | None = Option(None, "--reason", "-r", pith="Block reason"),
     status_filter: str | None = Option(None, "--status", "-s", pith="Filter by status"),
     json_output: bool = Option(False, "--json", pith="Output as JSON"),
+    pretty: bool = Option(False, "--pretty", pith="Indent JSON output for reading"),
     notes: str | None = Option(None, "--notes", pith="Additional notes"),
     output: str | None = Option(None, "--output", "-o", pith="Output file path for prompt"),
     interactive: bool = Option(False, "--interactive", "-i", pith="Launch copilot with prompt"),
@@ -366,6 +337,7 @@ def feature(
         $ klondike feature verify F001 --evidence test-results/F001.png
         $ klondike feature block F002 --reason "Waiting for API"
         $ klondike feature show F001
+        $ klondike feature show F001 --json --pretty
         $ klondike feature edit F001 --notes "Implementation notes"
         $ klondike feature edit F001 --add-criteria "Must handle edge cases"
         $ klondike feature prompt F001
@@ -377,6 +349,17 @@ def feature(
         session start - Begin working on features
         copilot start - Launch copilot with context
     """
+    from .commands.features import (
+        feature_add,
+        feature_block,
+        feature_edit,
+        feature_list,
+        feature_prompt,
+        feature_show,
+        feature_start,
+        feature_verify,
+    )
+
     if action == "add":
         # For 'add' action, feature_id position is used as description if --description not given
         effective_description = description if description else feature_id
@@ -390,7 +373,7 @@ def feature(
     elif action == "block":
         feature_block(feature_id, reason)
     elif action == "show":
-        feature_show(feature_id, json_output)
+        feature_show(feature_id, json_output, pretty)
     elif action == "edit":
         feature_edit(feature_id, description, category, priority, notes, add_criteria)
     elif action == "prompt":
@@ -443,6 +426,8 @@ def session(
         status - Check project status
         feature start - Mark feature as in-progress
     """
+    from .commands.sessions import session_end, session_start
+
     if action == "start":
         session_start(focus)
     elif action == "end":
@@ -478,6 +463,8 @@ def validate() -> None:
         status - Quick project overview
         session start - Validates on session start
     """
+    from .commands.admin import validate_command
+
     validate_command()
 
 
@@ -519,6 +506,8 @@ def config(
         init - Initialize project with --prd option
         status - Show project status
     """
+    from .commands.admin import config_command
+
     config_command(key, value)
 
 
@@ -556,6 +545,8 @@ def completion(
     Related:
         help - Show command help
     """
+    from .commands.admin import completion_command
+
     completion_command(shell)
 
 
@@ -585,6 +576,8 @@ def progress(
         status - Quick status check
         session end - Auto-regenerates on session end
     """
+    from .commands.admin import progress_command
+
     progress_command(output, force=False)
 
 
@@ -621,6 +614,8 @@ def report(
         status - Quick status check
         progress - Regenerate agent-progress.md
     """
+    from .commands.reporting import report_command
+
     report_command(format_type, output, include_details)
 
 
@@ -663,6 +658,8 @@ def import_features(
         export-features - Export features to file
         feature add - Add individual features
     """
+    from .commands.io import import_features_command
+
     import_features_command(file_path, dry_run)
 
 
@@ -738,6 +735,12 @@ def copilot(
         status - Check project status first
         feature start - Mark a feature as in-progress
     """
+    from .commands.copilot_cmd import (
+        copilot_cleanup_worktrees,
+        copilot_list_worktrees,
+        copilot_start,
+    )
+
     if action == "start":
         copilot_start(
             model=model,
@@ -791,6 +794,8 @@ def export_features(
         import-features - Import features from file
         feature list - View features
     """
+    from .commands.io import export_features_command
+
     export_features_command(output, status_filter, include_all)
 
 
@@ -813,6 +818,7 @@ def mcp(
     action: str = Argument(..., pith="Action: serve, install, config"),
     transport: str = Option("stdio", "--transport", "-t", pith="Transport: stdio, streamable-http"),
     output: str | None = Option(None, "--output", "-o", pith="Output path for config file"),
+    compact: bool = Option(False, "--compact", pith="Print config to stdout as single-line JSON"),
 ) -> None:
     """Manage MCP (Model Context Protocol) server for AI agent integration.
 
@@ -839,18 +845,21 @@ def mcp(
         $ klondike mcp serve
         $ klondike mcp serve --transport streamable-http
         $ klondike mcp config --output mcp-config.json
+        $ klondike mcp config --compact
         $ klondike mcp install
 
     Related:
         copilot start - Launch copilot with klondike context
         status - Check project status
     """
+    from .commands.mcp_cmd import mcp_config, mcp_install, mcp_serve
+
     if action == "serve":
         mcp_serve(transport)
     elif action == "install":
         mcp_install(output)
     elif action == "config":
-        mcp_config(output)
+        mcp_config(output, compact)
     else:
         raise PithException(f"Unknown action: {action}. Use: serve, install, config")
 
@@ -885,6 +894,8 @@ def version(
         release - Create a new release
         status - Show project status
     """
+    from .commands.admin import version_command
+
     version_command(verbose=json_output)
 
 
@@ -902,6 +913,8 @@ def agents(action: str = Argument(..., pith="Action: generate")) -> None:
     """
     if action != "generate":
         raise PithException("Unknown action: use 'generate'")
+    from .commands.agents_cmd import agents_generate_command
+
     agents_generate_command()
 
 
@@ -935,6 +948,8 @@ def serve(
     Related:
         status - View project status (CLI alternative)
     """
+    from .commands.serve_cmd import serve_command
+
     serve_command(port, host, open_browser)
 
 
@@ -988,6 +1003,11 @@ def release(
         "--skip-tests",
         pith="Skip running tests before release",
     ),
+    in_process_tests: bool = Option(
+        False,
+        "--in-process-tests",
+        pith="Run pytest inside this process instead of a fresh 'uv run pytest'",
+    ),
 ) -> None:
     """Automate version bumping and release tagging.
 
@@ -1006,7 +1026,9 @@ def release(
         validate - Check project health before release
         status - View current project state
     """
-    release_command(version, bump, message, dry_run, push, skip_tests)
+    from .commands.release_cmd import release_command
+
+    release_command(version, bump, message, dry_run, push, skip_tests, in_process_tests)
 
 
 # --- Entry Point ---
@@ -1014,10 +1036,13 @@ def release(
 
 def main() -> None:
     """Entry point for klondike CLI."""
-    # Check for --no-color flag before running pith
-    if "--no-color" in sys.argv:
+    # Strip every --no-color flag in one pass before running pith
+    argv = [arg for arg in sys.argv if arg != "--no-color"]
+    if len(argv) != len(sys.argv):
+        from . import formatting
+
         formatting.set_no_color(True)
-        sys.argv.remove("--no-color")
+        sys.argv[:] = argv
 
     app.run()
 
@@ -2,16 +2,21 @@
 
 import re
 import sys
+from collections import Counter
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from pith import PithException, echo
 
 from ..data import (
     CONFIG_FILE,
+    PROGRESS_FILE,
     get_klondike_dir,
     load_config,
     load_features,
     load_progress,
+    regenerate_progress_md,
 )
 from ..models import FeatureStatus
 
@@ -20,6 +25,9 @@ try:
 except ImportError:
     __version__ = "0.0.0+unknown"
 
+# Feature IDs as written by 'feature add' (F001-F999)
+_FEATURE_ID_FORMAT = re.compile(r"^F\d{3}$")
+
 
 def validate_command() -> None:
     """Validate Klondike artifact integrity.
@@ -44,8 +52,20 @@ def validate_command() -> None:
     # Check features.json
     echo("🔍 Checking features.json...")
 
+    # One pass over the features; issues are still reported grouped by check
     actual_total = len(registry.features)
-    actual_passing = sum(1 for f in registry.features if f.passes)
+    actual_passing = 0
+    id_counts: Counter[str] = Counter()
+    format_issues: list[str] = []
+    evidence_issues: list[str] = []
+    for f in registry.features:
+        if f.passes:
+            actual_passing += 1
+        id_counts[f.id] += 1
+        if not _FEATURE_ID_FORMAT.match(f.id):
+            format_issues.append(f"Invalid feature ID format: {f.id}")
+        if f.status == FeatureStatus.VERIFIED and not f.evidence_links:
+            evidence_issues.append(f"Feature {f.id} is verified but has no evidence links")
 
     if registry.metadata.total_features != actual_total:
         issues.append(
@@ -58,42 +78,66 @@ def validate_command() -> None:
         )
 
     # Check for duplicate IDs
-    ids = [f.id for f in registry.features]
-    duplicates = [id for id in ids if ids.count(id) > 1]
+    duplicates = {fid for fid, count in id_counts.items() if count > 1}
     if duplicates:
-        issues.append(f"Duplicate feature IDs: {set(duplicates)}")
-
-    # Check feature ID format
-    for f in registry.features:
-        if not re.match(r"^F\d{3}$", f.id):
-            issues.append(f"Invalid feature ID format: {f.id}")
+        issues.append(f"Duplicate feature IDs: {duplicates}")
 
-    # Check verified features have evidence
-    for f in registry.features:
-        if f.status == FeatureStatus.VERIFIED and not f.evidence_links:
-            issues.append(f"Feature {f.id} is verified but has no evidence links")
+    # Feature ID format, then verified features without evidence
+    issues.extend(format_issues)
+    issues.extend(evidence_issues)
 
     # Check agent-progress.json
     echo("🔍 Checking agent-progress.json...")
 
     # Check session numbers are sequential
-    session_nums = [s.session_number for s in progress.sessions]
-    expected = list(range(1, len(session_nums) + 1))
-    if session_nums != expected:
-        issues.append(f"Session numbers not sequential: {session_nums}")
+    for position, session in enumerate(progress.sessions, 1):
+        if session.session_number != position:
+            issues.append(
+                f"Session numbers not sequential at position {position}: "
+                f"got {session.session_number}"
+            )
+            break
 
     # Report results
-    echo("")
     if issues:
-        echo(f"❌ Found {len(issues)} issue(s):")
-        for issue in issues:
-            echo(f"   • {issue}")
-        echo("")
-        echo("Run 'klondike session start' to auto-fix metadata counts.")
+        lines = ["", f"❌ Found {len(issues)} issue(s):"]
+        lines.extend(f"   • {issue}" for issue in issues)
+        lines += ["", "Run 'klondike session start' to auto-fix metadata counts."]
     else:
-        echo("✅ All artifacts valid!")
-        echo(f"   Features: {actual_total} total, {actual_passing} passing")
-        echo(f"   Sessions: {len(progress.sessions)}")
+        lines = [
+            "",
+            "✅ All artifacts valid!",
+            f"   Features: {actual_total} total, {actual_passing} passing",
+            f"   Sessions: {len(progress.sessions)}",
+        ]
+    echo("\n".join(lines))
+
+
+def _parse_int_setting(key: str, value: str) -> int:
+    """Parse an integer config value."""
+    try:
+        return int(value)
+    except ValueError:
+        raise PithException(f"Invalid value for {key}: must be an integer") from None
+
+
+def _parse_bool_setting(key: str, value: str) -> bool:
+    """Parse a true/false config value."""
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise PithException(f"Invalid value for {key}: must be true or false")
+
+
+# Config keys whose --set value is not stored as a plain string
+_CONFIG_VALUE_PARSERS: dict[str, Callable[[str, str], Any]] = {
+    "default_priority": _parse_int_setting,
+    "auto_regenerate_progress": _parse_bool_setting,
+}
+
+# Config keys that change what agent-progress.md contains or where it is written
+_PROGRESS_MD_KEYS = frozenset({"prd_source", "progress_output_path", "auto_regenerate_progress"})
 
 
 def config_command(
@@ -154,31 +198,26 @@ def config_command(
     # Set config value
     cfg = load_config(root)
 
-    # Handle special case for null/None
+    # Handle special case for null/None; typed keys convert the raw string
+    parsed: str | int | bool | None
     if value.lower() in ("null", "none", ""):
-        value = None
-    elif key in ("default_priority",):
-        try:
-            value = int(value)
-        except ValueError:
-            raise PithException(f"Invalid value for {key}: must be an integer") from None
-    elif key == "auto_regenerate_progress":
-        if value.lower() in ("true", "1", "yes"):
-            value = True
-        elif value.lower() in ("false", "0", "no"):
-            value = False
-        else:
-            raise PithException(f"Invalid value for {key}: must be true or false")
+        parsed = None
+    elif key in _CONFIG_VALUE_PARSERS:
+        parsed = _CONFIG_VALUE_PARSERS[key](key, value)
+    else:
+        parsed = value
 
     if not hasattr(cfg, key):
         raise PithException(f"Unknown config key: {key}")
 
-    setattr(cfg, key, value)
+    setattr(cfg, key, parsed)
 
     klondike_dir = get_klondike_dir(root)
     cfg.save(klondike_dir / CONFIG_FILE)
+    if key in _PROGRESS_MD_KEYS and (klondike_dir / PROGRESS_FILE).exists():
+        regenerate_progress_md(root, config=cfg)
 
-    echo(f"✅ Set {key} = {value}")
+    echo(f"✅ Set {key} = {parsed}")
 
 
 def completion_command(shell: str = "bash") -> None:
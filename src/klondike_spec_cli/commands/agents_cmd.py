@@ -22,31 +22,32 @@ def agents_generate_command() -> None:
     progress = load_progress(root)
     config = load_config(root)
 
-    lines: list[str] = []
-    lines.append(f"# {registry.project_name} — Agents Guide")
-    lines.append("")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    lines.append("")
-    lines.append("## Workflow Overview")
-    lines.append("- Use klondike CLI to manage features and sessions")
-    lines.append("- Do not edit .klondike JSON files directly; use CLI commands")
-    lines.append("- Keep one feature in progress at a time")
-    lines.append("")
-    lines.append("## Key Commands")
-    lines.append("```bash")
-    lines.append("klondike status")
-    lines.append("klondike feature list")
-    lines.append('klondike session start --focus "F00X - description"')
-    lines.append("klondike feature start F00X")
-    lines.append("```")
-    lines.append("")
-    lines.append("## Configuration")
-    lines.append(f"- default_category: {config.default_category}")
-    lines.append(f"- default_priority: {config.default_priority}")
-    lines.append(f"- verified_by: {config.verified_by}")
-    lines.append(f"- progress_output_path: {config.progress_output_path}")
-    lines.append("")
-    lines.append("## Current Priority Features")
+    lines = [
+        f"# {registry.project_name} — Agents Guide",
+        "",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        "",
+        "## Workflow Overview",
+        "- Use klondike CLI to manage features and sessions",
+        "- Do not edit .klondike JSON files directly; use CLI commands",
+        "- Keep one feature in progress at a time",
+        "",
+        "## Key Commands",
+        "```bash",
+        "klondike status",
+        "klondike feature list",
+        'klondike session start --focus "F00X - description"',
+        "klondike feature start F00X",
+        "```",
+        "",
+        "## Configuration",
+        f"- default_category: {config.default_category}",
+        f"- default_priority: {config.default_priority}",
+        f"- verified_by: {config.verified_by}",
+        f"- progress_output_path: {config.progress_output_path}",
+        "",
+        "## Current Priority Features",
+    ]
     for pf in progress.quick_reference.priority_features:
         lines.append(f"- {pf.id}: {pf.description} ({pf.status})")
 
@@ -70,15 +70,14 @@ def copilot_list_worktrees() -> None:
         echo("💡 Start a worktree session with: klondike copilot start --worktree")
         return
 
-    echo(f"🌳 Active Worktree Sessions ({len(worktrees)} total)")
-    echo("")
-
+    lines = [f"🌳 Active Worktree Sessions ({len(worktrees)} total)", ""]
     for wt in worktrees:
-        echo(f"   📂 {wt.worktree_path}")
-        echo(f"      Branch: {wt.branch_name}")
+        lines.append(f"   📂 {wt.worktree_path}")
+        lines.append(f"      Branch: {wt.branch_name}")
         if wt.feature_id:
-            echo(f"      Feature: {wt.feature_id}")
-        echo("")
+            lines.append(f"      Feature: {wt.feature_id}")
+        lines.append("")
+    echo("\n".join(lines))
 
 
 def copilot_cleanup_worktrees(force: bool = False) -> None:
@@ -3,12 +3,10 @@
 from __future__ import annotations
 
 import json
-import subprocess
 from datetime import datetime
 
 from pith import PithException, echo
 
-from .. import formatting
 from ..data import (
     load_config,
     load_features,
@@ -27,6 +25,24 @@ from ..validation import (
     validate_output_path,
 )
 
+# Status labels shown by 'feature show'
+_STATUS_ICONS = {
+    FeatureStatus.NOT_STARTED: "⏳ Not started",
+    FeatureStatus.IN_PROGRESS: "🔄 In progress",
+    FeatureStatus.BLOCKED: "🚫 Blocked",
+    FeatureStatus.VERIFIED: "✅ Verified",
+}
+
+
+def _parse_priority(priority: int | str) -> int:
+    """Return the priority option as an int (the CLI may pass it as a string)."""
+    if isinstance(priority, int):
+        return priority
+    try:
+        return int(priority)
+    except ValueError:
+        raise PithException(f"Invalid priority: {priority}. Use an integer from 1 to 5") from None
+
 
 def feature_add(
     description: str | None,
@@ -46,8 +62,7 @@ def feature_add(
     feature_id = registry.next_feature_id()
     # Use config defaults if not specified, accept any category string
     cat = category if category else config.default_category
-    # Ensure priority is an integer (CLI may pass as string)
-    prio = int(priority) if priority is not None else config.default_priority
+    prio = _parse_priority(priority) if priority is not None else config.default_priority
     acceptance = (
         [sanitize_string(c.strip()) or "" for c in criteria.split(",") if c.strip()]
         if criteria
@@ -69,10 +84,10 @@ def feature_add(
     registry.add_feature(feature)
     save_features(registry)
 
-    # Update quick reference and regenerate markdown
-    update_quick_reference(progress, registry)
-    save_progress(progress)
-    regenerate_progress_md()
+    # The progress log only changes when the priority features do
+    if update_quick_reference(progress, registry):
+        save_progress(progress)
+    regenerate_progress_md(progress=progress, config=config)
 
     echo(f"✅ Added feature {feature_id}: {description}")
     echo(f"   Category: {cat}, Priority: {prio}")
@@ -101,6 +116,8 @@ def feature_list(status_filter: str | None, json_output: bool) -> None:
         return
 
     # Use rich table for formatted output
+    from .. import formatting
+
     title = f"Features ({len(features)} total)"
     if status_filter:
         title += f" - {status_filter}"
@@ -127,31 +144,31 @@ def feature_start(feature_id: str | None) -> None:
     feature.last_worked_on = datetime.now().isoformat()
 
     save_features(registry)
-    update_quick_reference(progress, registry)
-    save_progress(progress)
-    regenerate_progress_md()
+    if update_quick_reference(progress, registry):
+        save_progress(progress)
+    regenerate_progress_md(progress=progress)
 
-    echo(f"🔄 Started: {validated_id} - {feature.description}")
-    echo(f"   Category: {feature.category}, Priority: {feature.priority}")
-    echo("")
+    lines = [
+        f"🔄 Started: {validated_id} - {feature.description}",
+        f"   Category: {feature.category}, Priority: {feature.priority}",
+        "",
+    ]
 
     # Show acceptance criteria
     if feature.acceptance_criteria:
-        echo("   📋 Acceptance Criteria:")
-        for ac in feature.acceptance_criteria:
-            echo(f"      • {ac}")
-        echo("")
+        lines.append("   📋 Acceptance Criteria:")
+        lines.extend(f"      • {ac}" for ac in feature.acceptance_criteria)
+        lines.append("")
 
     # Show notes if present
     if feature.notes:
-        echo("   📝 Notes:")
-        echo(f"      {feature.notes}")
-        echo("")
+        lines += ["   📝 Notes:", f"      {feature.notes}", ""]
 
     # Show if previously blocked
     if feature.blocked_by:
-        echo(f"   ⚠️  Previously blocked by: {feature.blocked_by}")
-        echo("")
+        lines += [f"   ⚠️  Previously blocked by: {feature.blocked_by}", ""]
+
+    echo("\n".join(lines))
 
 
 def feature_verify(feature_id: str | None, evidence: str | None) -> None:
@@ -183,9 +200,9 @@ def feature_verify(feature_id: str | None, evidence: str | None) -> None:
 
     registry.update_metadata()
     save_features(registry)
-    update_quick_reference(progress, registry)
-    save_progress(progress)
-    regenerate_progress_md()
+    if update_quick_reference(progress, registry):
+        save_progress(progress)
+    regenerate_progress_md(progress=progress, config=config)
 
     echo(f"✅ Verified: {feature_id} - {feature.description}")
     echo(f"   Evidence: {', '.join(evidence_paths)}")
@@ -216,9 +233,9 @@ def feature_block(feature_id: str | None, reason: str | None) -> None:
     feature.last_worked_on = datetime.now().isoformat()
 
     save_features(registry)
-    update_quick_reference(progress, registry)
-    save_progress(progress)
-    regenerate_progress_md()
+    if update_quick_reference(progress, registry):
+        save_progress(progress)
+    regenerate_progress_md(progress=progress, config=config)
 
     echo(f"🚫 Blocked: {feature_id} - {feature.description}")
     echo(f"   Reason: {reason}")
@@ -230,7 +247,7 @@ def feature_block(feature_id: str | None, reason: str | None) -> None:
     echo(f"   Reason: {reason}")
 
 
-def feature_show(feature_id: str | None, json_output: bool) -> None:
+def feature_show(feature_id: str | None, json_output: bool, pretty: bool) -> None:
     """Show feature details."""
     if not feature_id:
         raise PithException("Feature ID is required for 'show' action")
@@ -241,39 +258,41 @@ def feature_show(feature_id: str | None, json_output: bool) -> None:
         raise PithException(f"Feature not found: {feature_id}")
 
     if json_output:
-        echo(json.dumps(feature.to_dict(), indent=2))
+        # Compact by default for scripts; indenting bypasses the C encoder
+        if pretty:
+            echo(json.dumps(feature.to_dict(), indent=2))
+        else:
+            echo(json.dumps(feature.to_dict(), separators=(",", ":")))
         return
 
-    status_icon = {
-        FeatureStatus.NOT_STARTED: "⏳ Not started",
-        FeatureStatus.IN_PROGRESS: "🔄 In progress",
-        FeatureStatus.BLOCKED: "🚫 Blocked",
-        FeatureStatus.VERIFIED: "✅ Verified",
-    }.get(feature.status, str(feature.status))
+    status_icon = _STATUS_ICONS.get(feature.status, str(feature.status))
 
-    echo(f"📋 Feature: {feature.id}")
-    echo(f"   Description: {feature.description}")
-    echo(f"   Category: {feature.category}")
-    echo(f"   Priority: {feature.priority}")
-    echo(f"   Status: {status_icon}")
-    echo(f"   Passes: {'Yes' if feature.passes else 'No'}")
+    lines = [
+        f"📋 Feature: {feature.id}",
+        f"   Description: {feature.description}",
+        f"   Category: {feature.category}",
+        f"   Priority: {feature.priority}",
+        f"   Status: {status_icon}",
+        f"   Passes: {'Yes' if feature.passes else 'No'}",
+    ]
 
     if feature.acceptance_criteria:
-        echo("   Acceptance Criteria:")
-        for ac in feature.acceptance_criteria:
-            echo(f"     • {ac}")
+        lines.append("   Acceptance Criteria:")
+        lines.extend(f"     • {ac}" for ac in feature.acceptance_criteria)
 
     if feature.verified_at:
-        echo(f"   Verified: {feature.verified_at} by {feature.verified_by}")
+        lines.append(f"   Verified: {feature.verified_at} by {feature.verified_by}")
 
     if feature.evidence_links:
-        echo(f"   Evidence: {', '.join(feature.evidence_links)}")
+        lines.append(f"   Evidence: {', '.join(feature.evidence_links)}")
 
     if feature.blocked_by:
-        echo(f"   Blocked by: {feature.blocked_by}")
+        lines.append(f"   Blocked by: {feature.blocked_by}")
 
     if feature.notes:
-        echo(f"   Notes: {feature.notes}")
+        lines.append(f"   Notes: {feature.notes}")
+
+    echo("\n".join(lines))
 
 
 def feature_edit(
@@ -306,48 +325,104 @@ def feature_edit(
     if not feature:
         raise PithException(f"Feature not found: {feature_id}")
 
+    if notes is None and add_criteria is None and category is None and priority is None:
+        raise PithException(
+            "No changes specified. Use --notes, --add-criteria, --category, or --priority"
+        )
+
+    new_criteria: list[str] = []
+    if add_criteria is not None:
+        # Drop the empty pieces left by stray or trailing commas
+        new_criteria = [c.strip() for c in add_criteria.split(",") if c.strip()]
+        if not new_criteria:
+            raise PithException(
+                "No valid acceptance criteria given. Use --add-criteria with comma-separated text"
+            )
+
     changes: list[str] = []
 
-    # Update mutable fields
-    if notes is not None:
+    # Update mutable fields, skipping values that are already set
+    if notes is not None and notes != feature.notes:
         feature.notes = notes
         changes.append(f"notes: {notes}")
 
-    if add_criteria is not None:
-        new_criteria = [c.strip() for c in add_criteria.split(",")]
+    if new_criteria:
         feature.acceptance_criteria.extend(new_criteria)
         changes.append(f"added criteria: {', '.join(new_criteria)}")
 
-    if category is not None:
+    if category is not None and category != feature.category:
         # Accept any category string
         feature.category = category
         changes.append(f"category: {category}")
 
     if priority is not None:
-        # Ensure priority is an integer (CLI may pass as string)
-        prio = int(priority)
-        if prio < 1 or prio > 5:
+        prio = _parse_priority(priority)
+        if not 1 <= prio <= 5:
             raise PithException("Priority must be between 1 and 5")
-        feature.priority = prio
-        changes.append(f"priority: {prio}")
+        if prio != feature.priority:
+            feature.priority = prio
+            changes.append(f"priority: {prio}")
 
     if not changes:
-        raise PithException(
-            "No changes specified. Use --notes, --add-criteria, --category, or --priority"
-        )
+        # Nothing differs from the stored feature, so leave both files untouched
+        echo(f"ℹ️  No changes: {feature_id} already has these values")
+        return
 
     feature.last_worked_on = datetime.now().isoformat()
 
     save_features(registry)
-    update_quick_reference(progress, registry)
-    save_progress(progress)
-    regenerate_progress_md()
+    if update_quick_reference(progress, registry):
+        save_progress(progress)
+    regenerate_progress_md(progress=progress)
 
     echo(f"✏️  Updated: {feature_id} - {feature.description}")
     for change in changes:
         echo(f"   • {change}")
 
 
+# Static pre-commit section of 'feature prompt', shared by every call
+_PRE_COMMIT_PROMPT_LINES = (
+    "## Pre-Commit Verification Requirements",
+    "",
+    "Before committing any changes, you MUST:",
+    "",
+    "1. **Run linting:** Check for code style issues",
+    "   - Python: `uv run ruff check src tests`",
+    "   - Node.js: `npm run lint`",
+    "",
+    "2. **Run format check:** Ensure code is properly formatted",
+    "   - Python: `uv run ruff format --check src tests`",
+    "   - Node.js: `npm run format`",
+    "",
+    "3. **Run tests:** Verify all tests pass",
+    "   - Python: `uv run pytest`",
+    "   - Node.js (Bash): `CI=true npm test`",
+    "   - Node.js (PowerShell): `$env:CI='true'; npm test`",
+    "",
+    "4. **Build (if applicable):** Ensure project builds",
+    "   - Node.js: `npm run build`",
+    "",
+    "5. **Record results:** Document each command's exit code",
+    "",
+    "Only commit if ALL checks pass. Fix any issues before committing.",
+    "",
+)
+
+# Closing workflow section of 'feature prompt'; {feature_id} is filled per call
+_WORKFLOW_PROMPT_TEMPLATE = "\n".join(
+    [
+        "## Klondike Workflow",
+        "",
+        "1. Mark feature as started: `klondike feature start {feature_id}`",
+        "2. Implement the feature following acceptance criteria",
+        "3. Run pre-commit verification",
+        "4. Commit changes with descriptive message",
+        "5. Verify feature: `klondike feature verify {feature_id} --evidence <test-output>`",
+        "",
+    ]
+)
+
+
 def feature_prompt(
     feature_id: str | None,
     output: str | None,
@@ -382,25 +457,19 @@ def feature_prompt(
 
     # Acceptance criteria
     if feature.acceptance_criteria:
-        prompt_lines.append("## Acceptance Criteria")
-        prompt_lines.append("")
-        for i, criterion in enumerate(feature.acceptance_criteria, 1):
-            prompt_lines.append(f"{i}. {criterion}")
+        prompt_lines += ["## Acceptance Criteria", ""]
+        prompt_lines.extend(
+            f"{i}. {criterion}" for i, criterion in enumerate(feature.acceptance_criteria, 1)
+        )
         prompt_lines.append("")
 
     # Notes
     if feature.notes:
-        prompt_lines.append("## Implementation Notes")
-        prompt_lines.append("")
-        prompt_lines.append(feature.notes)
-        prompt_lines.append("")
+        prompt_lines += ["## Implementation Notes", "", feature.notes, ""]
 
     # Dependencies - check if feature has blocked_by or related features
     if feature.blocked_by:
-        prompt_lines.append("## Dependencies/Blockers")
-        prompt_lines.append("")
-        prompt_lines.append(f"- {feature.blocked_by}")
-        prompt_lines.append("")
+        prompt_lines += ["## Dependencies/Blockers", "", f"- {feature.blocked_by}", ""]
 
     # Add project context
     total = registry.metadata.total_features
@@ -418,54 +487,18 @@ def feature_prompt(
     )
 
     # Pre-commit verification instructions
-    prompt_lines.extend(
-        [
-            "## Pre-Commit Verification Requirements",
-            "",
-            "Before committing any changes, you MUST:",
-            "",
-            "1. **Run linting:** Check for code style issues",
-            "   - Python: `uv run ruff check src tests`",
-            "   - Node.js: `npm run lint`",
-            "",
-            "2. **Run format check:** Ensure code is properly formatted",
-            "   - Python: `uv run ruff format --check src tests`",
-            "   - Node.js: `npm run format`",
-            "",
-            "3. **Run tests:** Verify all tests pass",
-            "   - Python: `uv run pytest`",
-            "   - Node.js (Bash): `CI=true npm test`",
-            "   - Node.js (PowerShell): `$env:CI='true'; npm test`",
-            "",
-            "4. **Build (if applicable):** Ensure project builds",
-            "   - Node.js: `npm run build`",
-            "",
-            "5. **Record results:** Document each command's exit code",
-            "",
-            "Only commit if ALL checks pass. Fix any issues before committing.",
-            "",
-        ]
-    )
+    prompt_lines.extend(_PRE_COMMIT_PROMPT_LINES)
 
     # Workflow instructions
-    prompt_lines.extend(
-        [
-            "## Klondike Workflow",
-            "",
-            "1. Mark feature as started: `klondike feature start " + validated_id + "`",
-            "2. Implement the feature following acceptance criteria",
-            "3. Run pre-commit verification",
-            "4. Commit changes with descriptive message",
-            f"5. Verify feature: `klondike feature verify {validated_id} --evidence <test-output>`",
-            "",
-        ]
-    )
+    prompt_lines.append(_WORKFLOW_PROMPT_TEMPLATE.format(feature_id=validated_id))
 
     prompt_content = "\n".join(prompt_lines)
 
     # Handle output
     if interactive:
         # Launch copilot with this prompt
+        import subprocess
+
         from ..copilot import find_copilot_executable
 
         copilot_path = find_copilot_executable()
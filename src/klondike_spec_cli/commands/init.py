@@ -20,6 +20,7 @@ from klondike_spec_cli.templates import (
     FEATURES_TEMPLATE,
     PROGRESS_TEMPLATE,
     read_template,
+    substitute_vars,
 )
 
 
@@ -98,9 +99,12 @@ def upgrade_project(
         # No agent specified - upgrade all currently configured agents
         agents_to_upgrade = existing_config.configured_agents or [get_default_agent()]
 
+    # One clock reading for backup names and template variables
+    now = datetime.now()
+
     # Backup existing agent directories
     if not skip_github:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         for agent_name in agents_to_upgrade:
             adapter = get_agent(agent_name)
             if adapter.output_directory:
@@ -127,25 +131,23 @@ def upgrade_project(
     existing_config.save(config_path)
     echo(f"✅ Updated {CONFIG_FILE} (version: {__version__})")
 
+    # Existing progress supplies template metadata and agent-progress.md
+    progress_path = klondike_dir / PROGRESS_FILE
+    progress = ProgressLog.load(progress_path) if progress_path.exists() else None
+
     # Refresh agent templates
     agent_files_extracted: dict[str, int] = {}
     if not skip_github:
         # Determine project name from existing config or directory
         project_name = existing_config.__dict__.get("project_name", root.name)
-
-        # Get existing progress for metadata
-        progress_path = klondike_dir / PROGRESS_FILE
-        if progress_path.exists():
-            progress = ProgressLog.load(progress_path)
+        if progress is not None:
             project_name = progress.project_name
 
         # Prepare template variables
-        now = datetime.now().isoformat()
-        date_str = datetime.now().strftime("%Y-%m-%d")
         template_vars = {
             "{{PROJECT_NAME}}": project_name,
-            "{{CREATED_AT}}": now,
-            "{{DATE}}": date_str,
+            "{{CREATED_AT}}": now.isoformat(),
+            "{{DATE}}": now.strftime("%Y-%m-%d"),
         }
 
         for agent_name in agents_to_upgrade:
@@ -155,16 +157,21 @@ def upgrade_project(
             echo(f"✅ Refreshed {adapter.display_name} templates ({len(extracted)} files)")
 
     # Regenerate agent-progress.md
-    if (klondike_dir / PROGRESS_FILE).exists():
-        progress = ProgressLog.load(klondike_dir / PROGRESS_FILE)
+    if progress is not None:
         progress.save_markdown(root / PROGRESS_MD_FILE, prd_source=existing_config.prd_source)
         echo(f"✅ Regenerated {PROGRESS_MD_FILE}")
 
-    echo("")
-    echo("✨ Upgrade complete!")
-    echo("   Your features and session history have been preserved.")
     agents_str = ", ".join(agents_to_upgrade)
-    echo(f"   Agent templates updated to v{__version__}: {agents_str}")
+    echo(
+        "\n".join(
+            [
+                "",
+                "✨ Upgrade complete!",
+                "   Your features and session history have been preserved.",
+                f"   Agent templates updated to v{__version__}: {agents_str}",
+            ]
+        )
+    )
 
 
 def init_command(
@@ -283,30 +290,23 @@ def init_command(
     klondike_dir.mkdir(parents=True, exist_ok=True)
 
     # Prepare template variables
-    now = datetime.now().isoformat()
-    date = datetime.now().strftime("%Y-%m-%d")
+    now = datetime.now()
     template_vars = {
         "{{PROJECT_NAME}}": project_name,
-        "{{CREATED_AT}}": now,
-        "{{DATE}}": date,
+        "{{CREATED_AT}}": now.isoformat(),
+        "{{DATE}}": now.strftime("%Y-%m-%d"),
     }
 
     # Load and substitute features.json template
-    features_content = read_template(FEATURES_TEMPLATE)
-    for var, value in template_vars.items():
-        features_content = features_content.replace(var, value)
+    features_content = substitute_vars(read_template(FEATURES_TEMPLATE), template_vars)
     (klondike_dir / FEATURES_FILE).write_text(features_content, encoding="utf-8")
 
     # Load and substitute agent-progress.json template
-    progress_content = read_template(PROGRESS_TEMPLATE)
-    for var, value in template_vars.items():
-        progress_content = progress_content.replace(var, value)
+    progress_content = substitute_vars(read_template(PROGRESS_TEMPLATE), template_vars)
     (klondike_dir / PROGRESS_FILE).write_text(progress_content, encoding="utf-8")
 
     # Load and substitute config.yaml template
-    config_content = read_template(CONFIG_TEMPLATE)
-    for var, value in template_vars.items():
-        config_content = config_content.replace(var, value)
+    config_content = substitute_vars(read_template(CONFIG_TEMPLATE), template_vars)
     (klondike_dir / CONFIG_FILE).write_text(config_content, encoding="utf-8")
 
     # Determine which agents to initialize
@@ -334,23 +334,29 @@ def init_command(
             )
             agent_files_extracted[agent_name] = len(extracted)
 
-    echo(f"✅ Initialized Klondike project: {project_name}")
-    echo(f"   📁 Created {klondike_dir}")
-    echo(f"   📋 Created {FEATURES_FILE}")
-    echo(f"   📝 Created {PROGRESS_FILE}")
-    echo(f"   ⚙️  Created {CONFIG_FILE}")
-    echo(f"   📄 Generated {PROGRESS_MD_FILE}")
+    # Emit the summary as one write; echo flushes after every call
+    lines = [
+        f"✅ Initialized Klondike project: {project_name}",
+        f"   📁 Created {klondike_dir}",
+        f"   📋 Created {FEATURES_FILE}",
+        f"   📝 Created {PROGRESS_FILE}",
+        f"   ⚙️  Created {CONFIG_FILE}",
+        f"   📄 Generated {PROGRESS_MD_FILE}",
+    ]
     if prd_source:
-        echo(f"   📑 PRD source: {prd_source}")
+        lines.append(f"   📑 PRD source: {prd_source}")
     for agent_name, file_count in agent_files_extracted.items():
         if file_count > 0:
             adapter = get_agent(agent_name)
-            echo(f"   🤖 Configured {adapter.display_name} ({file_count} files)")
-    echo("")
-    echo("Next steps:")
-    echo("  1. Add features: klondike feature add --description 'My feature'")
-    echo("  2. List features: klondike feature list")
-    echo("  3. Check status: klondike status")
+            lines.append(f"   🤖 Configured {adapter.display_name} ({file_count} files)")
+    lines += [
+        "",
+        "Next steps:",
+        "  1. Add features: klondike feature add --description 'My feature'",
+        "  2. List features: klondike feature list",
+        "  3. Check status: klondike status",
+    ]
+    echo("\n".join(lines))
 
 
 def upgrade_command(
@@ -1,7 +1,14 @@
 """Import/export command handlers."""
 
 import json
+import os
+import re
+import stat
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
+from typing import Any, TextIO
 
 from pith import Argument, Option, PithException, echo
 
@@ -16,6 +23,36 @@ from klondike_spec_cli.data import (
 from klondike_spec_cli.models import Feature, FeatureStatus
 from klondike_spec_cli.validation import validate_file_path, validate_output_path
 
+# orjson is an optional speedup for JSON export (the "fast" extra); fall back to
+# stdlib json without it. Both write the same bytes: indent=2, non-ASCII unescaped.
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# Default acceptance criteria for imported features that don't specify any
+_DEFAULT_AC = ("Feature works as described",)
+
+# Write buffer for streamed exports (1 MiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Strings that can be written as plain YAML scalars without quoting
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z_/][A-Za-z0-9_ ./()-]*", re.ASCII)
+_YAML_RESERVED = frozenset({"true", "false", "yes", "no", "on", "off", "null"})
+# Characters YAML can't hold verbatim (line breaks other than \n, controls, BOM, surrogates)
+_YAML_NONPRINTABLE_RE = re.compile(
+    r"[\x00-\x08\x0b-\x1f\x7f-\x9f\u2028\u2029\ufeff\ud800-\udfff\ufffe\uffff]"
+)
+# Characters that must be escaped inside a double-quoted YAML scalar
+_YAML_ESCAPE_RE = re.compile(r'["\\\x00-\x1f\x7f-\x9f\u2028\u2029\ufeff\ud800-\udfff\ufffe\uffff]')
+_YAML_ESCAPES = {'"': '\\"', "\\": "\\\\", "\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+# Status value -> enum member, so invalid filters don't go through enum lookup + ValueError
+_STATUS_LOOKUP = {s.value: s for s in FeatureStatus}
+
 
 def import_features_command(
     file_path: str = Argument(..., pith="Path to YAML or JSON file with features"),
@@ -43,35 +80,37 @@ def import_features_command(
         export-features - Export features to file
         feature add - Add individual features
     """
-    import yaml
-
     # Validate file path
     input_path = validate_file_path(file_path, must_exist=True)
 
     # Validate extension
-    if input_path.suffix.lower() not in [".yaml", ".yml", ".json"]:
+    suffix = input_path.suffix.lower()
+    is_yaml = suffix in (".yaml", ".yml")
+    if not is_yaml and suffix != ".json":
         raise PithException(
             f"Unsupported file format: {input_path.suffix}. Use .yaml, .yml, or .json"
         )
 
-    # Load file content
-    content = input_path.read_text(encoding="utf-8")
+    # Parse based on extension, straight from the file handle
+    if is_yaml:
+        import yaml
 
-    # Parse based on extension
-    if input_path.suffix.lower() in [".yaml", ".yml"]:
-        try:
-            data = yaml.safe_load(content)
-        except yaml.YAMLError as e:
-            raise PithException(f"Invalid YAML: {e}") from e
-    elif input_path.suffix.lower() == ".json":
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise PithException(f"Invalid JSON: {e}") from e
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as YamlLoader
+
+        with input_path.open(encoding="utf-8") as fp:
+            try:
+                data = yaml.load(fp, Loader=YamlLoader)
+            except yaml.YAMLError as e:
+                raise PithException(f"Invalid YAML: {e}") from e
     else:
-        raise PithException(
-            f"Unsupported file format: {input_path.suffix}. Use .yaml, .yml, or .json"
-        )
+        with input_path.open(encoding="utf-8") as fp:
+            try:
+                data = json.load(fp)
+            except json.JSONDecodeError as e:
+                raise PithException(f"Invalid JSON: {e}") from e
 
     # Validate structure
     if not isinstance(data, dict):
@@ -94,6 +133,7 @@ def import_features_command(
     imported = 0
     skipped = 0
     errors: list[str] = []
+    new_features: list[Feature] = []
 
     for i, feat_data in enumerate(features_data):
         try:
@@ -130,9 +170,14 @@ def import_features_command(
                 errors.append(f"Feature {i + 1}: priority must be 1-5")
                 continue
 
-            criteria = feat_data.get("acceptance_criteria", ["Feature works as described"])
-            if not isinstance(criteria, list):
+            criteria = feat_data.get("acceptance_criteria", _DEFAULT_AC)
+            if criteria is _DEFAULT_AC:
+                criteria = list(_DEFAULT_AC)
+            elif isinstance(criteria, str):
                 criteria = [criteria]
+            elif not isinstance(criteria, list):
+                errors.append(f"Feature {i + 1}: acceptance_criteria must be a string or list")
+                continue
 
             notes = feat_data.get("notes")
 
@@ -147,7 +192,7 @@ def import_features_command(
                     acceptance_criteria=criteria,
                     notes=notes,
                 )
-                registry.add_feature(feature)
+                new_features.append(feature)
 
             imported += 1
             existing_ids.add(feat_id)
@@ -157,10 +202,11 @@ def import_features_command(
 
     # Save changes
     if not dry_run and imported > 0:
+        registry.add_features(new_features)
         save_features(registry)
-        update_quick_reference(progress, registry)
-        save_progress(progress)
-        regenerate_progress_md()
+        if update_quick_reference(progress, registry):
+            save_progress(progress)
+        regenerate_progress_md(progress=progress)
 
     # Summary
     echo("")
@@ -197,8 +243,6 @@ def export_features_command(
         import-features - Import features from file
         feature list - View features
     """
-    import yaml
-
     # Validate output path
     output_path = validate_output_path(output, extensions=[".yaml", ".yml", ".json"])
 
@@ -207,13 +251,12 @@ def export_features_command(
 
     # Apply status filter
     if status_filter:
-        try:
-            filter_status = FeatureStatus(status_filter)
-            features = registry.get_features_by_status(filter_status)
-        except ValueError as e:
+        filter_status = _STATUS_LOOKUP.get(status_filter)
+        if filter_status is None:
             raise PithException(
                 f"Invalid status: {status_filter}. Use: not-started, in-progress, blocked, verified"
-            ) from e
+            )
+        features = registry.get_features_by_status(filter_status)
 
     # Build export data
     features_data = []
@@ -244,9 +287,135 @@ def export_features_command(
     # Write to file
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if output_path.suffix.lower() == ".json":
-        output_path.write_text(json.dumps(export_data, indent=2), encoding="utf-8")
-    else:
-        output_path.write_text(yaml.dump(export_data, sort_keys=False), encoding="utf-8")
+    with _atomic_output(output_path) as tmp_path:
+        if output_path.suffix.lower() == ".json":
+            if ORJSON_AVAILABLE:
+                tmp_path.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            else:
+                # json.dump writes one small chunk per token, so give it a large buffer
+                with tmp_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fp:
+                    json.dump(export_data, fp, indent=2, ensure_ascii=False)
+        else:
+            try:
+                with tmp_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fp:
+                    _emit_features_yaml(export_data, fp)
+            except TypeError:
+                # Value outside the fixed export schema - let PyYAML handle it
+                import yaml
+
+                try:
+                    from yaml import CSafeDumper as YamlDumper
+                except ImportError:  # PyYAML built without libyaml
+                    from yaml import SafeDumper as YamlDumper
+
+                with tmp_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fp:
+                    yaml.dump(export_data, fp, Dumper=YamlDumper, sort_keys=False)
 
     echo(f"✅ Exported {len(features_data)} features to {output_path}")
+
+
+@contextmanager
+def _atomic_output(path: Path) -> Iterator[Path]:
+    """Yield a temporary sibling of path that replaces it once the block succeeds.
+
+    A failed or interrupted export leaves any existing file at path untouched.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        yield tmp_path
+        # Flush to disk before the rename so a crash cannot leave an empty file
+        # under the final name
+        fd = os.open(tmp_path, os.O_RDWR)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # Keep the mode of a file being replaced; a new file already has the
+        # umask default it was created with
+        if path.exists():
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _yaml_scalar(value: Any, indent: str) -> str:
+    """Format a scalar as YAML, using a literal block for multi-line strings.
+
+    Args:
+        value: The scalar value (str, int, bool or None)
+        indent: Indentation for block scalar content lines
+
+    Raises:
+        TypeError: If the value is not a supported scalar
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if not isinstance(value, str):
+        raise TypeError(f"Unsupported YAML scalar: {type(value).__name__}")
+
+    if (
+        _YAML_PLAIN_RE.fullmatch(value)
+        and not value.endswith(" ")
+        and value.lower() not in _YAML_RESERVED
+    ):
+        return value
+
+    # Literal block keeps multi-line notes readable; only used when it round-trips exactly
+    if (
+        "\n" in value
+        and value[0] not in " \t\n"
+        and not value.endswith(("\n", " ", "\t"))
+        and not _YAML_NONPRINTABLE_RE.search(value)
+    ):
+        return "|-\n" + "\n".join(indent + line if line else "" for line in value.split("\n"))
+
+    return '"' + _YAML_ESCAPE_RE.sub(_yaml_escape, value) + '"'
+
+
+def _yaml_escape(match: re.Match[str]) -> str:
+    """Escape a single character for a double-quoted YAML scalar."""
+    char = match.group()
+    escaped = _YAML_ESCAPES.get(char)
+    if escaped is not None:
+        return escaped
+    code = ord(char)
+    return f"\\x{code:02x}" if code <= 0xFF else f"\\u{code:04x}"
+
+
+def _emit_features_yaml(export_data: dict[str, Any], fp: TextIO) -> None:
+    """Write the export document as block-style YAML.
+
+    Handles the fixed export schema: top-level scalars plus the features list,
+    whose entries are flat mappings of scalars and lists of scalars. Output
+    uses the same block layout as yaml.dump(sort_keys=False).
+
+    Raises:
+        TypeError: If the data contains values outside that schema
+    """
+    w = fp.write
+    for key, value in export_data.items():
+        if not isinstance(value, list):
+            w(f"{key}: {_yaml_scalar(value, '  ')}\n")
+        elif not value:
+            w(f"{key}: []\n")
+        else:
+            w(f"{key}:\n")
+            for item in value:
+                if not isinstance(item, dict) or not item:
+                    raise TypeError("Expected a list of non-empty mappings")
+                prefix = "- "
+                for item_key, item_value in item.items():
+                    if not isinstance(item_value, list):
+                        w(f"{prefix}{item_key}: {_yaml_scalar(item_value, '    ')}\n")
+                    elif not item_value:
+                        w(f"{prefix}{item_key}: []\n")
+                    else:
+                        w(f"{prefix}{item_key}:\n")
+                        for element in item_value:
+                            w(f"  - {_yaml_scalar(element, '    ')}\n")
+                    prefix = "  "
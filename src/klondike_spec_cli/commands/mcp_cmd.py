@@ -8,7 +8,8 @@ from pathlib import Path
 
 from pith import PithException, echo
 
-from ..mcp_server import MCP_AVAILABLE, generate_mcp_config, generate_vscode_mcp_config, run_server
+# mcp_server is imported inside each handler: it pulls in the MCP SDK, which
+# dominates CLI startup and is only needed by the mcp subcommands.
 
 
 def mcp_serve(transport: str) -> None:
@@ -17,7 +18,9 @@ def mcp_serve(transport: str) -> None:
     Args:
         transport: Transport protocol to use (stdio or streamable-http)
     """
-    if not MCP_AVAILABLE:
+    from .. import mcp_server
+
+    if not mcp_server.MCP_AVAILABLE:
         # Write to stderr since stdout is reserved for MCP protocol in stdio mode
         sys.stderr.write("Error: MCP SDK not installed.\n")
         sys.stderr.write("Install with: pip install 'klondike-spec-cli[mcp]'\n")
@@ -37,7 +40,7 @@ def mcp_serve(transport: str) -> None:
         echo("")
 
     try:
-        run_server(transport=transport)
+        mcp_server.run_server(transport=transport)
     except KeyboardInterrupt:
         if transport != "stdio":
             echo("")
@@ -50,37 +53,48 @@ def mcp_install(output: str | None) -> None:
     Args:
         output: Optional output path for config file
     """
+    from ..mcp_server import generate_vscode_mcp_config
+
     # Default to .vscode/mcp.json in current workspace
-    if output:
-        output_path = Path(output)
-    else:
-        output_path = Path.cwd() / ".vscode" / "mcp.json"
+    output_path = Path(output) if output else Path.cwd() / ".vscode/mcp.json"
 
     config = generate_vscode_mcp_config(output_path)
 
-    echo("✅ MCP configuration installed")
-    echo(f"   📄 Config file: {output_path}")
-    echo("")
-    echo("📋 MCP Server Configuration:")
-    echo(json.dumps(config, indent=2))
-    echo("")
-    echo("💡 To use with GitHub Copilot:")
-    echo("   1. Reload VS Code window (Ctrl+Shift+P → 'Reload Window')")
-    echo("   2. The klondike MCP server will be available in Copilot Chat")
-    echo("")
-    echo("   Tools available: get_features, start_feature, verify_feature, etc.")
-
-
-def mcp_config(output: str | None) -> None:
+    echo(
+        "\n".join(
+            [
+                "✅ MCP configuration installed",
+                f"   📄 Config file: {output_path}",
+                "",
+                "📋 MCP Server Configuration:",
+                json.dumps(config, indent=2),
+                "",
+                "💡 To use with GitHub Copilot:",
+                "   1. Reload VS Code window (Ctrl+Shift+P → 'Reload Window')",
+                "   2. The klondike MCP server will be available in Copilot Chat",
+                "",
+                "   Tools available: get_features, start_feature, verify_feature, etc.",
+            ]
+        )
+    )
+
+
+def mcp_config(output: str | None, compact: bool) -> None:
     """Generate MCP configuration file.
 
     Args:
         output: Optional output path for config file
+        compact: Print the config to stdout without indentation
     """
+    from ..mcp_server import generate_mcp_config
+
     if output:
         output_path = Path(output)
         generate_mcp_config(output_path)
         echo(f"✅ MCP config written to: {output_path}")
     else:
         config = generate_mcp_config()
-        echo(json.dumps(config, indent=2))
+        if compact:
+            echo(json.dumps(config, separators=(",", ":")))
+        else:
+            echo(json.dumps(config, indent=2))
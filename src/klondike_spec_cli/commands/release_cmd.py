@@ -1,7 +1,15 @@
 """Release command - automate version bumping and release tagging."""
 
+import contextlib
+import importlib.util
+import io
+import os
 import re
+import shutil
+import signal
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
 
 from pith import PithException, echo
@@ -16,6 +24,18 @@ from ..git import (
     git_tag,
 )
 
+# __version__ assignment in the hatch-vcs generated _version.py; the group
+# excludes any dev/post suffix (e.g. "0.2.20.dev29+g1234" -> "0.2.20")
+_VERSION_FILE_RE = re.compile(
+    r"__version__\s*=\s*version\s*=\s*'([^']+?)(?:\.(?:dev|post)\d+[^']*)?'"
+)
+# Release versions must be plain MAJOR.MINOR.PATCH
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
+# Test run limits: seconds before the run is killed, lines of output kept for failures
+_TEST_TIMEOUT = 300
+_TEST_OUTPUT_TAIL_LINES = 2000
+
 
 def release_command(
     version: str | None = None,
@@ -24,6 +44,7 @@ def release_command(
     dry_run: bool = False,
     push: bool = True,
     skip_tests: bool = False,
+    in_process_tests: bool = False,
 ) -> None:
     """Automate version bumping and release tagging.
 
@@ -47,81 +68,51 @@ def release_command(
         echo("  klondike release --bump major # Bump major (0.2.0 -> 1.0.0)")
         return
 
-    # Calculate new version
+    # Calculate new version (_bump_version only produces valid X.Y.Z versions)
     if bump:
         new_version = _bump_version(current_version, bump)
     elif version:
         new_version = version.lstrip("v")
+        if not _SEMVER_RE.match(new_version):
+            raise PithException(
+                f"Invalid version format: {new_version}. Expected X.Y.Z (e.g., 0.3.0)"
+            )
     else:
         raise PithException("Either version or --bump must be specified")
 
-    # Validate version format
-    if not re.match(r"^\d+\.\d+\.\d+$", new_version):
-        raise PithException(f"Invalid version format: {new_version}. Expected X.Y.Z (e.g., 0.3.0)")
-
     tag_name = f"v{new_version}"
     release_msg = message or f"Release {tag_name}"
 
-    echo("📋 Release Plan")
-    echo("=" * 40)
-    echo(f"  Current version: {current_version}")
-    echo(f"  New version:     {new_version}")
-    echo(f"  Tag:             {tag_name}")
-    echo(f"  Message:         {release_msg}")
-    echo("")
+    echo(
+        "\n".join(
+            [
+                "📋 Release Plan",
+                "=" * 40,
+                f"  Current version: {current_version}",
+                f"  New version:     {new_version}",
+                f"  Tag:             {tag_name}",
+                f"  Message:         {release_msg}",
+                "",
+            ]
+        )
+    )
 
     if dry_run:
-        echo("⚠️  DRY RUN - No changes will be made")
-        echo("")
-        echo("Steps that would be performed:")
-        if not skip_tests:
-            echo("  1. Run tests")
-        echo(f"  {'2' if not skip_tests else '1'}. Commit any pending changes")
-        if push:
-            echo(f"  {'3' if not skip_tests else '2'}. Push commit to remote")
-        echo(f"  {'4' if not skip_tests else '3'}. Create tag {tag_name}")
-        if push:
-            echo(f"  {'5' if not skip_tests else '4'}. Push tag to remote")
-        echo("")
-        echo("After completion:")
-        echo("  - TestPyPI: Automatic (triggered by tag push)")
-        echo("  - PyPI: Create GitHub Release from tag")
+        echo(_render_dry_run_plan(tag_name, skip_tests, push))
         return
 
-    # Check for uncommitted changes (optional - can release with dirty tree)
-    status = get_git_status()
-
     # Run tests unless skipped
     if not skip_tests:
         echo("🧪 Running tests...")
-        try:
-            result = subprocess.run(
-                ["uv", "run", "pytest", "-q"],
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-            if result.returncode != 0:
-                echo("❌ Tests failed:")
-                echo(result.stdout)
-                echo(result.stderr)
+        if in_process_tests and importlib.util.find_spec("pytest") is not None:
+            if not _run_tests_in_process():
                 raise PithException("Tests must pass before release")
             echo("✅ Tests passed")
-        except FileNotFoundError:
-            # Try with pytest directly
-            result = subprocess.run(
-                ["pytest", "-q"],
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-            if result.returncode != 0:
-                raise PithException("Tests must pass before release") from None
-            echo("✅ Tests passed")
-        except subprocess.TimeoutExpired as err:
-            raise PithException("Tests timed out") from err
+        else:
+            _run_tests_subprocess()
 
     # For hatch-vcs, version is derived from tags, so we just commit any uncommitted work
+    # (checked after the tests, which may leave the tree changed)
     status = get_git_status()
     if status.has_uncommitted_changes:
         echo("📦 Committing pending changes...")
@@ -154,13 +145,151 @@ def release_command(
             raise PithException(f"Failed to push tag: {output}")
         echo("✅ Pushed tag")
 
-    echo("")
-    echo(f"🎉 Released {tag_name}!")
-    echo("")
-    echo("Next steps:")
-    echo("  📦 TestPyPI: Publishing automatically (triggered by tag)")
-    echo("  📦 PyPI: Create a GitHub Release from the tag:")
-    echo(f"     https://github.com/ThomasRohde/klondike-spec-cli/releases/new?tag={tag_name}")
+    echo(
+        "\n".join(
+            [
+                "",
+                f"🎉 Released {tag_name}!",
+                "",
+                "Next steps:",
+                "  📦 TestPyPI: Publishing automatically (triggered by tag)",
+                "  📦 PyPI: Create a GitHub Release from the tag:",
+                f"     https://github.com/ThomasRohde/klondike-spec-cli/releases/new?tag={tag_name}",
+            ]
+        )
+    )
+
+
+def _render_dry_run_plan(tag_name: str, skip_tests: bool, push: bool) -> str:
+    """Render the dry-run step list as one block of text.
+
+    Args:
+        tag_name: Tag the release would create
+        skip_tests: Whether the test step is skipped
+        push: Whether commit and tag would be pushed
+
+    Returns:
+        Multi-line plan text
+    """
+    steps = []
+    if not skip_tests:
+        steps.append("Run tests")
+    steps.append("Commit any pending changes")
+    if push:
+        steps.append("Push commit to remote")
+    steps.append(f"Create tag {tag_name}")
+    if push:
+        steps.append("Push tag to remote")
+
+    lines = ["⚠️  DRY RUN - No changes will be made", "", "Steps that would be performed:"]
+    lines.extend(f"  {n}. {step}" for n, step in enumerate(steps, 1))
+    lines.extend(
+        [
+            "",
+            "After completion:",
+            "  - TestPyPI: Automatic (triggered by tag push)",
+            "  - PyPI: Create GitHub Release from tag",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def _run_tests_subprocess() -> None:
+    """Run the test suite in a fresh interpreter via uv (or plain pytest).
+
+    Raises:
+        PithException: If no test runner is found, or the tests fail or time out
+    """
+    # Prefer uv's project environment, falling back to pytest on PATH
+    if shutil.which("uv"):
+        cmd = ["uv", "run", "pytest", "-q"]
+    elif shutil.which("pytest"):
+        cmd = ["pytest", "-q"]
+    else:
+        raise PithException("No test runner found. Install uv or pytest, or use --skip-tests")
+
+    if not _run_test_command(cmd):
+        raise PithException("Tests must pass before release")
+    echo("✅ Tests passed")
+
+
+def _run_test_command(cmd: list[str]) -> bool:
+    """Run a test command, streaming its output and keeping only the tail.
+
+    Only the last _TEST_OUTPUT_TAIL_LINES lines are held in memory; they are
+    shown if the tests fail.
+
+    Args:
+        cmd: Command and arguments to run
+
+    Returns:
+        True if the command exited successfully
+
+    Raises:
+        PithException: If the tests time out
+    """
+    timed_out = threading.Event()
+    # Run the runner in its own process group so a timeout also kills its children
+    # (e.g. pytest under 'uv run'), which would otherwise keep the output pipe open
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        start_new_session=True,
+    ) as proc:
+
+        def _kill() -> None:
+            if hasattr(os, "killpg"):
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(proc.pid, signal.SIGKILL)
+            else:  # Windows has no process groups to signal
+                proc.kill()
+
+        def _on_timeout() -> None:
+            timed_out.set()
+            _kill()
+
+        timer = threading.Timer(_TEST_TIMEOUT, _on_timeout)
+        timer.start()
+        try:
+            assert proc.stdout is not None
+            tail = deque(proc.stdout, maxlen=_TEST_OUTPUT_TAIL_LINES)
+            returncode = proc.wait()
+        except BaseException:
+            # The new session no longer receives the terminal's Ctrl+C, so stop
+            # the runner ourselves rather than leaving it running orphaned
+            _kill()
+            proc.wait()
+            raise
+        finally:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise PithException("Tests timed out")
+    if returncode != 0:
+        echo("❌ Tests failed:")
+        echo("".join(tail))
+    return returncode == 0
+
+
+def _run_tests_in_process() -> bool:
+    """Run pytest inside this interpreter, skipping interpreter and uv start-up.
+
+    Output is captured and only shown if the tests fail.
+
+    Returns:
+        True if the tests passed
+    """
+    import pytest
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        exit_code = pytest.main(["-q"])
+    if exit_code != 0:
+        echo("❌ Tests failed:")
+        echo(buf.getvalue())
+    return exit_code == 0
 
 
 def _get_current_version() -> str:
@@ -171,7 +300,9 @@ def _get_current_version() -> str:
     """
     version_file = Path.cwd() / "src" / "klondike_spec_cli" / "_version.py"
 
-    if not version_file.exists():
+    try:
+        content = version_file.read_text()
+    except FileNotFoundError:
         # Fallback to git tags
         try:
             result = subprocess.run(
@@ -187,15 +318,11 @@ def _get_current_version() -> str:
                 "Could not determine version. No _version.py or git tags found."
             ) from None
 
-    content = version_file.read_text()
-    match = re.search(r"__version__\s*=\s*version\s*=\s*'([^']+)'", content)
+    match = _VERSION_FILE_RE.search(content)
     if not match:
         raise PithException("Could not parse version from _version.py")
 
-    version = match.group(1)
-    # Strip dev/dirty suffixes (e.g., "0.2.20.dev29" -> "0.2.20")
-    version = re.sub(r"\.(dev|post)\d+.*$", "", version)
-    return version
+    return match.group(1)
 
 
 def _bump_version(version: str, bump_type: str) -> str:
@@ -208,14 +335,10 @@ def _bump_version(version: str, bump_type: str) -> str:
     Returns:
         New version string
     """
-    parts = version.split(".")
-    if len(parts) != 3:
+    if not _SEMVER_RE.match(version):
         raise PithException(f"Invalid version format: {version}")
 
-    try:
-        major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2])
-    except ValueError as err:
-        raise PithException(f"Invalid version format: {version}") from err
+    major, minor, patch = map(int, version.split("."))
 
     if bump_type == "major":
         return f"{major + 1}.0.0"
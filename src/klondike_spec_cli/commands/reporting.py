@@ -40,10 +40,11 @@ def report_command(
     current_session = progress_log.get_current_session()
 
     # Get features by status
-    verified = registry.get_features_by_status(FeatureStatus.VERIFIED)
-    in_progress = registry.get_features_by_status(FeatureStatus.IN_PROGRESS)
-    blocked = registry.get_features_by_status(FeatureStatus.BLOCKED)
-    not_started = registry.get_features_by_status(FeatureStatus.NOT_STARTED)
+    by_status = registry.group_by_status()
+    verified = by_status[FeatureStatus.VERIFIED]
+    in_progress = by_status[FeatureStatus.IN_PROGRESS]
+    blocked = by_status[FeatureStatus.BLOCKED]
+    not_started = by_status[FeatureStatus.NOT_STARTED]
 
     # Get priority features for next steps
     priority = registry.get_priority_features(5)
@@ -334,6 +335,5 @@ def generate_plain_report(
 def generate_progress_bar(percentage: float, width: int = 40) -> str:
     """Generate an ASCII progress bar."""
     filled = int(width * percentage / 100)
-    empty = width - filled
-    bar = "█" * filled + "░" * empty
+    bar = ("█" * filled).ljust(width, "░")
     return f"[{bar}] {percentage}%"
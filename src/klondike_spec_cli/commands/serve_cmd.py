@@ -778,7 +778,7 @@ def serve_command(
                 progress = load_progress(root)
                 update_quick_reference(progress, registry)
                 save_progress(progress, root)
-                regenerate_progress_md(root)
+                regenerate_progress_md(root, progress=progress)
             except Exception:
                 pass  # Progress update is optional
 
@@ -888,7 +888,7 @@ def serve_command(
                 progress = load_progress(root)
                 update_quick_reference(progress, registry)
                 save_progress(progress, root)
-                regenerate_progress_md(root)
+                regenerate_progress_md(root, progress=progress)
             except Exception:
                 pass  # Progress update is optional
 
@@ -978,7 +978,7 @@ def serve_command(
                 progress = load_progress(root)
                 update_quick_reference(progress, registry)
                 save_progress(progress, root)
-                regenerate_progress_md(root)
+                regenerate_progress_md(root, progress=progress)
             except Exception:
                 pass  # Progress update is optional
 
@@ -1431,7 +1431,7 @@ def serve_command(
             update_quick_reference(progress, registry)
             save_features(registry, root)
             save_progress(progress, root)
-            regenerate_progress_md(root)
+            regenerate_progress_md(root, progress=progress)
 
             # Broadcast event to WebSocket clients
             await manager.broadcast(
@@ -1536,7 +1536,7 @@ def serve_command(
 
             update_quick_reference(progress, registry)
             save_progress(progress, root)
-            regenerate_progress_md(root)
+            regenerate_progress_md(root, progress=progress)
 
             # Broadcast event to WebSocket clients
             await manager.broadcast(
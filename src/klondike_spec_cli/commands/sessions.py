@@ -26,38 +26,39 @@ def session_start(focus: str | None) -> None:
     registry = load_features()
     progress = load_progress()
 
-    # Check git status first
+    # Check git status first; announce it before the (slow) git call
     echo("🔍 Checking git status...")
     git_status = get_git_status()
+    lines: list[str] = []
     if git_status.is_git_repo:
-        echo(f"   {format_git_status(git_status)}")
+        lines.append(f"   {format_git_status(git_status)}")
         if git_status.has_uncommitted_changes:
-            echo("   ⚠️  Consider committing or stashing changes before starting.")
+            lines.append("   ⚠️  Consider committing or stashing changes before starting.")
     else:
-        echo("   ℹ️  Not a git repository")
-    echo("")
+        lines.append("   ℹ️  Not a git repository")
+    lines.append("")
 
     # Validate artifact integrity
-    echo("🔍 Validating artifacts...")
+    lines.append("🔍 Validating artifacts...")
 
     # Check metadata consistency
     actual_total = len(registry.features)
     actual_passing = sum(1 for f in registry.features if f.passes)
 
     if registry.metadata.total_features != actual_total:
-        echo(
+        lines.append(
             f"⚠️  Warning: metadata.totalFeatures ({registry.metadata.total_features}) != actual ({actual_total})"
         )
         registry.metadata.total_features = actual_total
 
     if registry.metadata.passing_features != actual_passing:
-        echo(
+        lines.append(
             f"⚠️  Warning: metadata.passingFeatures ({registry.metadata.passing_features}) != actual ({actual_passing})"
         )
         registry.metadata.passing_features = actual_passing
 
-    echo("✅ Artifacts validated")
-    echo("")
+    lines += ["✅ Artifacts validated", ""]
+    echo("\n".join(lines))
 
     # Create new session
     session_num = progress.next_session_number()
@@ -80,31 +81,31 @@ def session_start(focus: str | None) -> None:
     update_quick_reference(progress, registry)
     save_features(registry)
     save_progress(progress)
-    regenerate_progress_md()
+    config = load_config()
+    regenerate_progress_md(progress=progress, config=config)
 
     # Show status
     total = registry.metadata.total_features
     passing = registry.metadata.passing_features
     progress_pct = round(passing / total * 100, 1) if total > 0 else 0
 
-    echo(f"🚀 Session {session_num} Started")
-    echo(f"   Focus: {new_session.focus}")
-    echo("")
-    echo(f"📊 Project Status: {passing}/{total} features ({progress_pct}%)")
+    lines = [
+        f"🚀 Session {session_num} Started",
+        f"   Focus: {new_session.focus}",
+        "",
+        f"📊 Project Status: {passing}/{total} features ({progress_pct}%)",
+    ]
 
     # Show priority features
     priority = registry.get_priority_features(3)
     if priority:
-        echo("")
-        echo("♠️  Priority Features:")
-        for f in priority:
-            echo(f"   • {f.id}: {f.description}")
+        lines += ["", "♠️  Priority Features:"]
+        lines.extend(f"   • {f.id}: {f.description}" for f in priority)
 
-    echo("")
-    echo("💡 Tip: Use 'klondike feature start <ID>' to mark a feature as in-progress")
+    lines += ["", "💡 Tip: Use 'klondike feature start <ID>' to mark a feature as in-progress"]
+    echo("\n".join(lines))
 
     # Send notification
-    config = load_config()
     ntfy_client = get_ntfy_client(config.ntfy)
     if ntfy_client:
         ntfy_client.session_started(session_num, new_session.focus)
@@ -140,13 +141,13 @@ def session_end(
         current.focus = summary
 
     if completed:
-        current.completed = [c.strip() for c in completed.split(",")]
+        current.completed = [c.strip() for c in completed.split(",") if c.strip()]
 
     if blockers:
-        current.blockers = [b.strip() for b in blockers.split(",")]
+        current.blockers = [b.strip() for b in blockers.split(",") if b.strip()]
 
     if next_steps:
-        current.next_steps = [n.strip() for n in next_steps.split(",")]
+        current.next_steps = [n.strip() for n in next_steps.split(",") if n.strip()]
     else:
         # Auto-generate next steps from priority features
         priority = registry.get_priority_features(3)
@@ -155,15 +156,14 @@ def session_end(
     progress.current_status = "Session Ended"
     update_quick_reference(progress, registry)
     save_progress(progress)
-    regenerate_progress_md()
-
-    echo(f"✅ Session {current.session_number} Ended")
-    echo(f"   Focus: {current.focus}")
+    config = load_config()
+    regenerate_progress_md(progress=progress, config=config)
 
+    lines = [f"✅ Session {current.session_number} Ended", f"   Focus: {current.focus}"]
     if current.completed:
-        echo("   Completed:")
-        for item in current.completed:
-            echo(f"     • {item}")
+        lines.append("   Completed:")
+        lines.extend(f"     • {item}" for item in current.completed)
+    echo("\n".join(lines))
 
     # Check git status and optionally auto-commit
     git_status = get_git_status()
@@ -188,7 +188,6 @@ def session_end(
     echo("")
 
     # Send notification
-    config = load_config()
     ntfy_client = get_ntfy_client(config.ntfy)
     if ntfy_client:
         features_completed = len(current.completed) if current.completed else 0
@@ -52,11 +52,13 @@ def ensure_klondike_dir(root: Path | None = None) -> Path:
 
 def load_features(root: Path | None = None) -> FeatureRegistry:
     """Load the feature registry."""
-    klondike_dir = ensure_klondike_dir(root)
-    features_path = klondike_dir / FEATURES_FILE
-    if not features_path.exists():
-        raise PithException(f"Features file not found: {features_path}")
-    return FeatureRegistry.load(features_path)
+    features_path = get_klondike_dir(root) / FEATURES_FILE
+    # Open directly; only stat the directory to explain a missing file
+    try:
+        return FeatureRegistry.load(features_path)
+    except FileNotFoundError:
+        ensure_klondike_dir(root)
+        raise PithException(f"Features file not found: {features_path}") from None
 
 
 def save_features(registry: FeatureRegistry, root: Path | None = None) -> None:
@@ -71,11 +73,12 @@ def save_features(registry: FeatureRegistry, root: Path | None = None) -> None:
 
 def load_progress(root: Path | None = None) -> ProgressLog:
     """Load the progress log."""
-    klondike_dir = ensure_klondike_dir(root)
-    progress_path = klondike_dir / PROGRESS_FILE
-    if not progress_path.exists():
-        raise PithException(f"Progress file not found: {progress_path}")
-    return ProgressLog.load(progress_path)
+    progress_path = get_klondike_dir(root) / PROGRESS_FILE
+    try:
+        return ProgressLog.load(progress_path)
+    except FileNotFoundError:
+        ensure_klondike_dir(root)
+        raise PithException(f"Progress file not found: {progress_path}") from None
 
 
 def save_progress(progress: ProgressLog, root: Path | None = None) -> None:
@@ -85,12 +88,26 @@ def save_progress(progress: ProgressLog, root: Path | None = None) -> None:
     progress.save(progress_path)
 
 
-def regenerate_progress_md(root: Path | None = None) -> None:
-    """Regenerate agent-progress.md from JSON."""
+def regenerate_progress_md(
+    root: Path | None = None,
+    progress: ProgressLog | None = None,
+    config: Config | None = None,
+) -> None:
+    """Regenerate agent-progress.md from JSON.
+
+    Does nothing when auto_regenerate_progress is disabled in the config;
+    'klondike progress' still rebuilds the file on demand. Callers that
+    already hold the saved progress log or config can pass them to skip
+    re-reading those files.
+    """
     if root is None:
         root = Path.cwd()
-    config = load_config(root)
-    progress = load_progress(root)
+    if config is None:
+        config = load_config(root)
+    if not config.auto_regenerate_progress:
+        return
+    if progress is None:
+        progress = load_progress(root)
     md_path = root / config.progress_output_path
     progress.save_markdown(md_path, prd_source=config.prd_source)
 
@@ -111,10 +128,13 @@ def load_config(root: Path | None = None) -> Config:
 # --- Quick Reference Functions ---
 
 
-def update_quick_reference(progress: ProgressLog, registry: FeatureRegistry) -> None:
-    """Update the quick reference section with current priority features."""
+def update_quick_reference(progress: ProgressLog, registry: FeatureRegistry) -> bool:
+    """Update the quick reference section with current priority features.
+
+    Returns True if the priority feature list changed.
+    """
     priority_features = registry.get_priority_features(3)
-    progress.quick_reference.priority_features = [
+    refs = [
         PriorityFeatureRef(
             id=f.id,
             description=f.description,
@@ -122,3 +142,7 @@ def update_quick_reference(progress: ProgressLog, registry: FeatureRegistry) ->
         )
         for f in priority_features
     ]
+    if refs == progress.quick_reference.priority_features:
+        return False
+    progress.quick_reference.priority_features = refs
+    return True
@@ -184,10 +184,11 @@ def print_status_summary(registry: FeatureRegistry, project_name: str) -> None:
     console = get_console()
 
     total = len(registry.features)
-    verified = len(registry.get_features_by_status(FeatureStatus.VERIFIED))
-    in_progress = len(registry.get_features_by_status(FeatureStatus.IN_PROGRESS))
-    blocked = len(registry.get_features_by_status(FeatureStatus.BLOCKED))
-    not_started = len(registry.get_features_by_status(FeatureStatus.NOT_STARTED))
+    counts = registry.count_by_status()
+    verified = counts[FeatureStatus.VERIFIED]
+    in_progress = counts[FeatureStatus.IN_PROGRESS]
+    blocked = counts[FeatureStatus.BLOCKED]
+    not_started = counts[FeatureStatus.NOT_STARTED]
 
     percentage = (verified / total * 100) if total > 0 else 0.0
 
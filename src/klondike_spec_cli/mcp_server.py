@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -117,12 +118,15 @@ def _load_config(root: Path | None = None) -> Config:
     return Config.load(config_path)
 
 
-def _regenerate_progress_md(root: Path | None = None) -> None:
-    """Regenerate agent-progress.md from JSON."""
+def _regenerate_progress_md(root: Path | None = None, progress: ProgressLog | None = None) -> None:
+    """Regenerate agent-progress.md from JSON, reusing an already-saved progress log."""
     if root is None:
         root = _get_klondike_root()
     config = _load_config(root)
-    progress = _load_progress(root)
+    if not config.auto_regenerate_progress:
+        return
+    if progress is None:
+        progress = _load_progress(root)
     md_path = root / PROGRESS_MD_FILE
     progress.save_markdown(md_path, prd_source=config.prd_source)
 
@@ -274,7 +278,7 @@ def create_mcp_server() -> FastMCP | None:
             _save_features(registry)
             _update_quick_reference(progress, registry)
             _save_progress(progress)
-            _regenerate_progress_md()
+            _regenerate_progress_md(progress=progress)
 
             result: dict[str, Any] = {
                 "success": True,
@@ -327,7 +331,7 @@ def create_mcp_server() -> FastMCP | None:
             _save_features(registry)
             _update_quick_reference(progress, registry)
             _save_progress(progress)
-            _regenerate_progress_md()
+            _regenerate_progress_md(progress=progress)
 
             return {
                 "success": True,
@@ -374,7 +378,7 @@ def create_mcp_server() -> FastMCP | None:
             _save_features(registry)
             _update_quick_reference(progress, registry)
             _save_progress(progress)
-            _regenerate_progress_md()
+            _regenerate_progress_md(progress=progress)
 
             return {
                 "success": True,
@@ -409,10 +413,9 @@ def create_mcp_server() -> FastMCP | None:
             current_session = progress.get_current_session()
             priority_features = registry.get_priority_features(3)
 
-            by_status = {}
-            for status in FeatureStatus:
-                features = registry.get_features_by_status(status)
-                by_status[status.value] = len(features)
+            by_status = {
+                status.value: count for status, count in registry.count_by_status().items()
+            }
 
             return {
                 "project": registry.project_name,
@@ -468,7 +471,7 @@ def create_mcp_server() -> FastMCP | None:
             _update_quick_reference(progress, registry)
             _save_features(registry)
             _save_progress(progress)
-            _regenerate_progress_md()
+            _regenerate_progress_md(progress=progress)
 
             total = registry.metadata.total_features
             passing = registry.metadata.passing_features
@@ -536,7 +539,7 @@ def create_mcp_server() -> FastMCP | None:
             progress.current_status = "Session Ended"
             _update_quick_reference(progress, registry)
             _save_progress(progress)
-            _regenerate_progress_md()
+            _regenerate_progress_md(progress=progress)
 
             return {
                 "success": True,
@@ -575,7 +578,12 @@ def create_mcp_server() -> FastMCP | None:
 
             # Check features.json
             actual_total = len(registry.features)
-            actual_passing = sum(1 for f in registry.features if f.passes)
+            actual_passing = 0
+            id_counts: Counter[str] = Counter()
+            for f in registry.features:
+                if f.passes:
+                    actual_passing += 1
+                id_counts[f.id] += 1
 
             if registry.metadata.total_features != actual_total:
                 issues.append(
@@ -590,16 +598,18 @@ def create_mcp_server() -> FastMCP | None:
                 )
 
             # Check for duplicate IDs
-            ids = [f.id for f in registry.features]
-            duplicates = [fid for fid in ids if ids.count(fid) > 1]
+            duplicates = {fid for fid, count in id_counts.items() if count > 1}
             if duplicates:
-                issues.append(f"Duplicate feature IDs: {set(duplicates)}")
+                issues.append(f"Duplicate feature IDs: {duplicates}")
 
             # Check session numbers are sequential
-            session_nums = [s.session_number for s in progress.sessions]
-            expected = list(range(1, len(session_nums) + 1))
-            if session_nums != expected:
-                issues.append(f"Session numbers not sequential: {session_nums}")
+            for position, session in enumerate(progress.sessions, 1):
+                if session.session_number != position:
+                    issues.append(
+                        f"Session numbers not sequential at position {position}: "
+                        f"got {session.session_number}"
+                    )
+                    break
 
             return {
                 "valid": len(issues) == 0,
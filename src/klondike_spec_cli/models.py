@@ -7,6 +7,7 @@ agent-progress.json files.
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -147,8 +148,11 @@ class FeatureMetadata:
     def from_dict(cls, data: dict[str, Any]) -> FeatureMetadata:
         """Create FeatureMetadata from dictionary."""
         return cls(
-            created_at=data.get("createdAt", datetime.now().isoformat()),
-            last_updated=data.get("lastUpdated", datetime.now().isoformat()),
+            # Only read the clock for missing timestamps, not on every load
+            created_at=data["createdAt"] if "createdAt" in data else datetime.now().isoformat(),
+            last_updated=(
+                data["lastUpdated"] if "lastUpdated" in data else datetime.now().isoformat()
+            ),
             total_features=data.get("totalFeatures", 0),
             passing_features=data.get("passingFeatures", 0),
         )
@@ -217,8 +221,7 @@ class FeatureRegistry:
 
     def save(self, path: Path) -> None:
         """Save FeatureRegistry to a JSON file."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
 
     def get_feature(self, feature_id: str) -> Feature | None:
         """Get a feature by ID using indexed lookup (O(1))."""
@@ -231,6 +234,12 @@ class FeatureRegistry:
         self._invalidate_index()
         self.update_metadata()
 
+    def add_features(self, features: list[Feature]) -> None:
+        """Add several features at once, updating metadata a single time."""
+        self.features.extend(features)
+        self._invalidate_index()
+        self.update_metadata()
+
     def update_metadata(self) -> None:
         """Update metadata counts."""
         self.metadata.total_features = len(self.features)
@@ -250,6 +259,20 @@ class FeatureRegistry:
         """Get all features with a given status."""
         return [f for f in self.features if f.status == status]
 
+    def group_by_status(self) -> dict[FeatureStatus, list[Feature]]:
+        """Bucket features by status in a single pass, preserving registry order."""
+        groups: dict[FeatureStatus, list[Feature]] = {status: [] for status in FeatureStatus}
+        for f in self.features:
+            group = groups.get(f.status)
+            if group is not None:
+                group.append(f)
+        return groups
+
+    def count_by_status(self) -> dict[FeatureStatus, int]:
+        """Count features per status in a single pass over the registry."""
+        counts = Counter(f.status for f in self.features)
+        return {status: counts[status] for status in FeatureStatus}
+
     def get_priority_features(self, limit: int = 3) -> list[Feature]:
         """Get top priority incomplete features (excludes blocked features)."""
         incomplete = [
@@ -360,7 +383,7 @@ class Session:
         """Create Session from dictionary."""
         return cls(
             session_number=data.get("sessionNumber", 1),
-            date=data.get("date", datetime.now().strftime("%Y-%m-%d")),
+            date=data["date"] if "date" in data else datetime.now().strftime("%Y-%m-%d"),
             agent=data.get("agent", "Coding Agent"),
             duration=data.get("duration", ""),
             focus=data.get("focus", ""),
@@ -444,7 +467,7 @@ class ProgressLog:
         """Create ProgressLog from dictionary."""
         return cls(
             project_name=data.get("projectName", "unnamed-project"),
-            started_at=data.get("startedAt", datetime.now().isoformat()),
+            started_at=data["startedAt"] if "startedAt" in data else datetime.now().isoformat(),
             current_status=data.get("currentStatus", "Initialized"),
             sessions=[Session.from_dict(s) for s in data.get("sessions", [])],
             quick_reference=QuickReference.from_dict(data.get("quickReference", {})),
@@ -459,8 +482,7 @@ class ProgressLog:
 
     def save(self, path: Path) -> None:
         """Save ProgressLog to a JSON file."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
 
     def add_session(self, session: Session) -> None:
         """Add a session to the log."""
@@ -634,11 +656,16 @@ class Config:
         """Load Config from a YAML file."""
         import yaml
 
-        if not path.exists():
-            return cls()  # Return default config if file doesn't exist
+        try:
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
 
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = yaml.load(f, Loader=YamlLoader) or {}
+        except FileNotFoundError:
+            return cls()  # Return default config if file doesn't exist
         return cls.from_dict(data)
 
     def save(self, path: Path) -> None:
@@ -6,20 +6,39 @@ when important events occur (session start/end, feature verified/blocked, errors
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 from dataclasses import dataclass, field
 from typing import Any
 
-try:
-    import requests
-
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+# requests is only imported when a notification is sent: it is the most
+# expensive import on the CLI start-up path (models -> ntfy)
+REQUESTS_AVAILABLE = importlib.util.find_spec("requests") is not None
 
 logger = logging.getLogger(__name__)
 
 
+def _requests() -> Any:
+    """Return the requests module, importing it on first use.
+
+    The module is cached as ``ntfy.requests`` so patching that attribute
+    behaves as it did when requests was imported at module level.
+    """
+    module = globals().get("requests")
+    if module is None:
+        import requests as module
+
+        globals()["requests"] = module
+    return module
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``requests`` lazily so it stays addressable as a module attribute."""
+    if name == "requests" and REQUESTS_AVAILABLE:
+        return _requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 @dataclass
 class NtfyEventConfig:
     """Configuration for which event types should trigger notifications."""
@@ -164,6 +183,8 @@ class NtfyClient:
         if self.config.token:
             headers["Authorization"] = f"Bearer {self.config.token}"
 
+        requests = _requests()
+
         try:
             response = requests.post(
                 url,
@@ -7,6 +7,8 @@ Templates can be extracted on demand using the functions in this module.
 from __future__ import annotations
 
 import importlib.resources
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -32,6 +34,9 @@ CLAUDE_TEMPLATES_PACKAGE = "klondike_spec_cli.templates.claude_templates"
 # Backward compatibility alias
 GITHUB_TEMPLATES_PACKAGE = COPILOT_TEMPLATES_PACKAGE
 
+# Template placeholders such as {{PROJECT_NAME}}
+_TEMPLATE_VAR_RE = re.compile(r"\{\{[A-Z_]+\}\}")
+
 
 def get_template_path(template_name: str) -> Traversable:
     """Get a traversable path to a template file.
@@ -54,9 +59,13 @@ def get_template_path(template_name: str) -> Traversable:
     return importlib.resources.files(__package__).joinpath(template_name)
 
 
+@lru_cache(maxsize=len(AVAILABLE_TEMPLATES))
 def read_template(template_name: str) -> str:
     """Read a template file's content.
 
+    Templates are immutable package data, so each one is read at most once
+    per process.
+
     Args:
         template_name: Name of the template file
 
@@ -67,6 +76,19 @@ def read_template(template_name: str) -> str:
     return template_path.read_text(encoding="utf-8")
 
 
+def substitute_vars(content: str, template_vars: dict[str, str]) -> str:
+    """Replace template placeholders in a single pass.
+
+    Args:
+        content: Template text
+        template_vars: Mapping of placeholders (e.g. '{{DATE}}') to values
+
+    Returns:
+        Content with known placeholders replaced; unknown ones are left as is
+    """
+    return _TEMPLATE_VAR_RE.sub(lambda m: template_vars.get(m.group(), m.group()), content)
+
+
 def extract_template(template_name: str, destination: Path, overwrite: bool = False) -> Path:
     """Extract a template file to a destination path.
 
@@ -424,6 +424,97 @@ class TestFeatureAddCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_feature_add_outside_priority_skips_progress_rewrite(self) -> None:
+        """Test the progress log is only saved when priority features change."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                for name in ("First", "Second", "Third"):
+                    runner.invoke(app, ["feature", "add", "--description", name, "--priority", "1"])
+
+                # Re-save the log compactly so any rewrite shows up as indentation
+                progress_json = Path(tmpdir) / ".klondike" / "agent-progress.json"
+                compact = json.dumps(json.loads(progress_json.read_text(encoding="utf-8")))
+                progress_json.write_text(compact, encoding="utf-8")
+                progress_md = Path(tmpdir) / "agent-progress.md"
+                progress_md.unlink()
+
+                result = runner.invoke(
+                    app, ["feature", "add", "--description", "Later", "--priority", "5"]
+                )
+                assert result.exit_code == 0
+                assert progress_json.read_text(encoding="utf-8") == compact
+                # The markdown is still rebuilt after every change
+                assert progress_md.exists()
+
+                result = runner.invoke(app, ["feature", "block", "F001", "--reason", "Waiting"])
+                assert result.exit_code == 0
+                assert progress_json.read_text(encoding="utf-8") != compact
+            finally:
+                os.chdir(original_cwd)
+
+    def test_feature_edit_regenerates_progress_md(self) -> None:
+        """Test editing a feature rebuilds agent-progress.md even if the log is unchanged."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Test feature"])
+                progress_md = Path(tmpdir) / "agent-progress.md"
+                progress_md.unlink()
+
+                result = runner.invoke(app, ["feature", "edit", "F001", "--notes", "More detail"])
+
+                assert result.exit_code == 0
+                assert "F001" in progress_md.read_text(encoding="utf-8")
+            finally:
+                os.chdir(original_cwd)
+
+    def test_feature_add_respects_auto_regenerate_progress(self) -> None:
+        """Test agent-progress.md is left alone when auto-regeneration is off."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["config", "auto_regenerate_progress", "--set", "false"])
+
+                progress_md = Path(tmpdir) / "agent-progress.md"
+                progress_md.unlink()
+
+                result = runner.invoke(app, ["feature", "add", "--description", "First"])
+
+                assert result.exit_code == 0
+                assert not progress_md.exists()
+                progress_path = Path(tmpdir) / ".klondike" / "agent-progress.json"
+                data = json.loads(progress_path.read_text(encoding="utf-8"))
+                assert data["quickReference"]["priorityFeatures"][0]["id"] == "F001"
+            finally:
+                os.chdir(original_cwd)
+
+    def test_config_set_prd_source_regenerates_progress_md(self) -> None:
+        """Test setting a rendered config key rebuilds agent-progress.md."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+
+                result = runner.invoke(app, ["config", "prd_source", "--set", "docs/prd.md"])
+
+                assert result.exit_code == 0
+                progress_md = (Path(tmpdir) / "agent-progress.md").read_text(encoding="utf-8")
+                assert "## PRD Source: [docs/prd.md](docs/prd.md)" in progress_md
+            finally:
+                os.chdir(original_cwd)
+
 
 class TestFeatureListCommand:
     """Integration tests for 'klondike feature list' command."""
@@ -485,6 +576,24 @@ class TestFeatureListCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_feature_list_json_escapes_non_ascii(self) -> None:
+        """Test feature list --json output does not depend on optional encoders."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Café émoji 🚀"])
+
+                result = runner.invoke(app, ["feature", "list", "--json"])
+
+                assert result.exit_code == 0
+                assert "Caf\\u00e9 \\u00e9moji \\ud83d\\ude80" in result.output
+                assert json.loads(result.output)[0]["description"] == "Café émoji 🚀"
+            finally:
+                os.chdir(original_cwd)
+
     def test_feature_list_status_filter(self) -> None:
         """Test feature list with status filter."""
         runner = CliRunner()
@@ -528,6 +637,40 @@ class TestStatusCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_status_json_skips_rich_and_git(self) -> None:
+        """Test status --json does not import rich or the git helpers."""
+        import subprocess
+        import sys
+
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init", "--name", "json-project"])
+            finally:
+                os.chdir(original_cwd)
+
+            code = (
+                "import sys; sys.argv = ['klondike', 'status', '--json']\n"
+                "from klondike_spec_cli.cli import main\n"
+                "try:\n"
+                "    main()\n"
+                "except SystemExit:\n"
+                "    pass\n"
+                "print('rich' in sys.modules, 'klondike_spec_cli.git' in sys.modules)"
+            )
+            result = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=tmpdir,
+            )
+
+            assert '"projectName": "json-project"' in result.stdout
+            assert result.stdout.splitlines()[-1] == "False False"
+
 
 class TestValidateCommand:
     """Integration tests for 'klondike validate' command."""
@@ -548,6 +691,53 @@ class TestValidateCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_validate_reports_duplicate_ids(self) -> None:
+        """Test validate flags feature IDs that appear more than once."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "First"])
+                runner.invoke(app, ["feature", "add", "--description", "Second"])
+
+                features_path = Path(tmpdir) / ".klondike" / "features.json"
+                data = json.loads(features_path.read_text(encoding="utf-8"))
+                data["features"][1]["id"] = "F001"
+                features_path.write_text(json.dumps(data), encoding="utf-8")
+
+                result = runner.invoke(app, ["validate"])
+
+                assert "Duplicate feature IDs: {'F001'}" in result.output
+                assert "F002" not in result.output
+            finally:
+                os.chdir(original_cwd)
+
+    def test_validate_reports_first_out_of_sequence_session(self) -> None:
+        """Test validate points at the first session whose number is out of order."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["session", "start", "--focus", "Second"])
+                runner.invoke(app, ["session", "start", "--focus", "Third"])
+
+                progress_path = Path(tmpdir) / ".klondike" / "agent-progress.json"
+                data = json.loads(progress_path.read_text(encoding="utf-8"))
+                data["sessions"][1]["sessionNumber"] = 5
+                data["sessions"][2]["sessionNumber"] = 7
+                progress_path.write_text(json.dumps(data), encoding="utf-8")
+
+                result = runner.invoke(app, ["validate"])
+
+                assert "Session numbers not sequential at position 2: got 5" in result.output
+                assert "position 3" not in result.output
+            finally:
+                os.chdir(original_cwd)
+
 
 class TestReportCommand:
     """Integration tests for 'klondike report' command."""
@@ -634,6 +824,48 @@ class TestReportCommand:
                 os.chdir(original_cwd)
 
 
+class TestFeatureShowCommand:
+    """Tests for klondike feature show command."""
+
+    def test_show_json_is_compact_by_default(self) -> None:
+        """Test show --json emits compact JSON unless --pretty is given."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Test feature"])
+
+                result = runner.invoke(app, ["feature", "show", "F001", "--json"])
+
+                assert result.exit_code == 0
+                assert result.output.count("\n") == 1
+                data = json.loads(result.output)
+                assert data["id"] == "F001"
+                assert data["description"] == "Test feature"
+            finally:
+                os.chdir(original_cwd)
+
+    def test_show_json_pretty(self) -> None:
+        """Test show --json --pretty emits indented JSON."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Test feature"])
+
+                result = runner.invoke(app, ["feature", "show", "F001", "--json", "--pretty"])
+
+                assert result.exit_code == 0
+                assert result.output.startswith('{\n  "id": "F001"')
+                assert json.loads(result.output)["description"] == "Test feature"
+            finally:
+                os.chdir(original_cwd)
+
+
 class TestFeatureEditCommand:
     """Tests for klondike feature edit command."""
 
@@ -685,6 +917,32 @@ class TestFeatureEditCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_edit_ignores_empty_criteria(self) -> None:
+        """Test stray commas in --add-criteria do not store empty criteria."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Test feature"])
+
+                result = runner.invoke(
+                    app, ["feature", "edit", "F001", "--add-criteria", "Extra,, ,"]
+                )
+
+                assert result.exit_code == 0
+                assert "added criteria: Extra" in result.output
+
+                features_path = Path(tmpdir) / ".klondike" / "features.json"
+                data = json.loads(features_path.read_text(encoding="utf-8"))
+                assert data["features"][0]["acceptanceCriteria"] == [
+                    "Feature works as described",
+                    "Extra",
+                ]
+            finally:
+                os.chdir(original_cwd)
+
     def test_edit_forbids_description_change(self) -> None:
         """Test edit command forbids description modification."""
         runner = CliRunner()
@@ -729,6 +987,71 @@ class TestFeatureEditCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_edit_rejects_non_numeric_priority(self) -> None:
+        """Test edit reports a non-numeric priority as a CLI error."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Test feature"])
+
+                result = runner.invoke(app, ["feature", "edit", "F001", "--priority", "high"])
+
+                assert result.exit_code != 0
+                assert "Invalid priority: high" in result.output
+            finally:
+                os.chdir(original_cwd)
+
+    def test_edit_with_unchanged_values_skips_save(self) -> None:
+        """Test edit leaves features.json untouched when nothing differs."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(
+                    app,
+                    ["feature", "add", "--description", "Test feature", "--priority", "3"],
+                )
+                features_path = Path(tmpdir) / ".klondike" / "features.json"
+                before = features_path.read_text(encoding="utf-8")
+
+                result = runner.invoke(
+                    app, ["feature", "edit", "F001", "--priority", "3", "--category", "core"]
+                )
+
+                assert result.exit_code == 0
+                assert "No changes: F001 already has these values" in result.output
+                assert features_path.read_text(encoding="utf-8") == before
+            finally:
+                os.chdir(original_cwd)
+
+    def test_edit_rejects_criteria_with_no_text(self) -> None:
+        """Test --add-criteria made only of commas is an error, not a no-op."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Test feature"])
+                features_path = Path(tmpdir) / ".klondike" / "features.json"
+                before = features_path.read_text(encoding="utf-8")
+
+                result = runner.invoke(
+                    app, ["feature", "edit", "F001", "--add-criteria", ",", "--notes", "New"]
+                )
+
+                assert result.exit_code != 0
+                assert "No valid acceptance criteria given" in result.output
+                assert "already has these values" not in result.output
+                assert features_path.read_text(encoding="utf-8") == before
+            finally:
+                os.chdir(original_cwd)
+
     def test_edit_requires_changes(self) -> None:
         """Test edit command requires at least one change."""
         runner = CliRunner()
@@ -796,6 +1119,189 @@ class TestImportExportFeatures:
             finally:
                 os.chdir(original_cwd)
 
+    def test_export_yaml_writer_matches_pyyaml(self) -> None:
+        """Test the export YAML writer loads back to the same data as PyYAML output."""
+        import io
+
+        import yaml
+
+        from klondike_spec_cli.commands.io import _emit_features_yaml
+
+        export_data = {
+            "project": "demo",
+            "version": "0.1.0",
+            "exported_at": "2024-01-01T12:00:00",
+            "features": [
+                {
+                    "id": "F001",
+                    "description": "Login: handles 'quotes' and \"double\" # hash",
+                    "category": "yes",
+                    "priority": 1,
+                    "passes": False,
+                    "verifiedAt": None,
+                    "dependencies": [],
+                    "acceptance_criteria": ["- leading dash", "Émoji 🚀", "tab\there"],
+                    "notes": "First line\n  indented line\n\nLast line",
+                },
+                {"id": "F002", "description": "", "acceptance_criteria": ["\n trailing\n"]},
+            ],
+        }
+        buf = io.StringIO()
+        _emit_features_yaml(export_data, buf)
+
+        expected = yaml.safe_load(yaml.dump(export_data, sort_keys=False))
+        assert yaml.safe_load(buf.getvalue()) == expected == export_data
+        assert "notes: |-\n    First line\n" in buf.getvalue()
+
+    def test_export_features_to_json_without_orjson(self, monkeypatch) -> None:
+        """Test JSON export falls back to the streamed stdlib encoder."""
+        from klondike_spec_cli.commands import io as io_cmd
+
+        monkeypatch.setattr(io_cmd, "ORJSON_AVAILABLE", False)
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Feature JSON"])
+
+                result = runner.invoke(app, ["export-features", "export.json"])
+
+                assert result.exit_code == 0
+                data = json.loads(Path("export.json").read_text(encoding="utf-8"))
+                assert data["features"][0]["description"] == "Feature JSON"
+            finally:
+                os.chdir(original_cwd)
+
+    def test_export_json_is_identical_with_and_without_orjson(self, monkeypatch) -> None:
+        """Test both JSON encoders write the same bytes, including non-ASCII text."""
+        import datetime as dt
+
+        import pytest
+
+        pytest.importorskip("orjson")
+        from klondike_spec_cli.commands import io as io_cmd
+
+        class FixedDatetime(dt.datetime):
+            @classmethod
+            def now(cls, tz=None):  # type: ignore[override]
+                return cls(2025, 1, 2, 3, 4, 5)
+
+        monkeypatch.setattr(io_cmd, "datetime", FixedDatetime)
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Café émoji 🚀"])
+
+                result = runner.invoke(app, ["export-features", "fast.json", "--all"])
+                assert result.exit_code == 0
+
+                monkeypatch.setattr(io_cmd, "ORJSON_AVAILABLE", False)
+                result = runner.invoke(app, ["export-features", "stdlib.json", "--all"])
+                assert result.exit_code == 0
+
+                fast = Path("fast.json").read_bytes()
+                assert fast == Path("stdlib.json").read_bytes()
+                assert "Café émoji 🚀".encode() in fast
+            finally:
+                os.chdir(original_cwd)
+
+    def test_export_failure_keeps_existing_file(self, monkeypatch) -> None:
+        """Test a failed export leaves the previous file intact and no temp file."""
+        from klondike_spec_cli.commands import io as io_cmd
+
+        def fail(export_data, fp):
+            fp.write("partial")
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(io_cmd, "_emit_features_yaml", fail)
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                Path("export.yaml").write_text("previous: export\n", encoding="utf-8")
+
+                result = runner.invoke(app, ["export-features", "export.yaml"])
+
+                assert result.exit_code != 0
+                assert Path("export.yaml").read_text(encoding="utf-8") == "previous: export\n"
+                assert not list(Path(tmpdir).glob(".export.yaml.*"))
+            finally:
+                os.chdir(original_cwd)
+
+    def test_export_keeps_mode_and_syncs_before_replace(self, monkeypatch) -> None:
+        """Test an export flushes to disk and keeps the replaced file's permissions."""
+        import stat
+
+        import pytest
+
+        if os.name == "nt":
+            pytest.skip("POSIX permission bits")
+
+        calls: list[str] = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def record_fsync(fd):
+            calls.append("fsync")
+            real_fsync(fd)
+
+        def record_replace(src, dst):
+            calls.append("replace")
+            real_replace(src, dst)
+
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                Path("export.yaml").write_text("previous: export\n", encoding="utf-8")
+                os.chmod("export.yaml", 0o640)
+                monkeypatch.setattr(os, "fsync", record_fsync)
+                monkeypatch.setattr(os, "replace", record_replace)
+
+                result = runner.invoke(app, ["export-features", "export.yaml"])
+
+                assert result.exit_code == 0
+                assert calls == ["fsync", "replace"]
+                assert stat.S_IMODE(Path("export.yaml").stat().st_mode) == 0o640
+                assert "features:" in Path("export.yaml").read_text(encoding="utf-8")
+            finally:
+                os.chdir(original_cwd)
+
+    def test_export_falls_back_to_pyyaml(self, monkeypatch) -> None:
+        """Test values the fast emitter rejects are exported through PyYAML."""
+        import yaml
+
+        from klondike_spec_cli.commands import io as io_cmd
+
+        def reject(export_data, fp):
+            fp.write("partial")
+            raise TypeError("unsupported value")
+
+        monkeypatch.setattr(io_cmd, "_emit_features_yaml", reject)
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                runner.invoke(app, ["feature", "add", "--description", "Fallback feature"])
+
+                result = runner.invoke(app, ["export-features", "export.yaml"])
+
+                assert result.exit_code == 0
+                data = yaml.safe_load(Path("export.yaml").read_text(encoding="utf-8"))
+                assert data["features"][0]["description"] == "Fallback feature"
+            finally:
+                os.chdir(original_cwd)
+
     def test_import_features_from_yaml(self) -> None:
         """Test importing features from YAML."""
         runner = CliRunner()
@@ -860,6 +1366,35 @@ class TestImportExportFeatures:
             finally:
                 os.chdir(original_cwd)
 
+    def test_import_validates_acceptance_criteria_type(self) -> None:
+        """Test that string criteria are wrapped and non-list criteria are rejected."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+
+                import_content = """features:
+  - description: "Single criterion"
+    acceptance_criteria: "Works"
+  - description: "Bad criteria"
+    acceptance_criteria:
+      key: value
+"""
+                Path("import.yaml").write_text(import_content)
+
+                result = runner.invoke(app, ["import-features", "import.yaml"])
+
+                assert result.exit_code == 0
+                assert "Imported: 1" in result.output
+                assert "Feature 2: acceptance_criteria must be a string or list" in result.output
+
+                show_result = runner.invoke(app, ["feature", "show", "F001", "--json"])
+                assert '"Works"' in show_result.output
+            finally:
+                os.chdir(original_cwd)
+
     def test_import_dry_run(self) -> None:
         """Test import dry-run mode."""
         runner = CliRunner()
@@ -887,6 +1422,36 @@ class TestImportExportFeatures:
             finally:
                 os.chdir(original_cwd)
 
+    def test_import_outside_priority_skips_progress_rewrite(self) -> None:
+        """Test importing low-priority features does not re-save the progress log."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+                for name in ("First", "Second", "Third"):
+                    runner.invoke(app, ["feature", "add", "--description", name, "--priority", "1"])
+
+                # Re-save the log compactly so any rewrite shows up as indentation
+                progress_json = Path(tmpdir) / ".klondike" / "agent-progress.json"
+                compact = json.dumps(json.loads(progress_json.read_text(encoding="utf-8")))
+                progress_json.write_text(compact, encoding="utf-8")
+
+                import_content = """features:
+  - description: "Later feature"
+    priority: 5
+"""
+                Path("import.yaml").write_text(import_content)
+
+                result = runner.invoke(app, ["import-features", "import.yaml"])
+
+                assert result.exit_code == 0
+                assert "Imported: 1" in result.output
+                assert progress_json.read_text(encoding="utf-8") == compact
+            finally:
+                os.chdir(original_cwd)
+
     def test_export_with_status_filter(self) -> None:
         """Test exporting features with status filter."""
         runner = CliRunner()
@@ -908,6 +1473,23 @@ class TestImportExportFeatures:
             finally:
                 os.chdir(original_cwd)
 
+    def test_export_with_invalid_status_filter(self) -> None:
+        """Test exporting with an unknown status filter fails cleanly."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+
+                result = runner.invoke(app, ["export-features", "out.yaml", "--status", "done"])
+
+                assert result.exit_code == 1
+                assert "Invalid status: done" in result.output
+                assert not Path("out.yaml").exists()
+            finally:
+                os.chdir(original_cwd)
+
 
 class TestCopilotCommand:
     """Integration tests for 'klondike copilot' command."""
@@ -1160,6 +1742,26 @@ class TestReleaseCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_release_strips_dev_suffix_from_current_version(self) -> None:
+        """Test dev/local suffixes from hatch-vcs are dropped from the current version."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                version_dir = Path(tmpdir) / "src" / "klondike_spec_cli"
+                version_dir.mkdir(parents=True)
+                version_file = version_dir / "_version.py"
+                version_file.write_text("__version__ = version = '1.2.3.dev4+g1a2b3c.d20250101'\n")
+
+                result = runner.invoke(app, ["release", "--bump", "patch", "--dry-run"])
+
+                assert result.exit_code == 0
+                assert "Current version: 1.2.3" in result.output
+                assert "New version:     1.2.4" in result.output
+            finally:
+                os.chdir(original_cwd)
+
     def test_release_dry_run(self) -> None:
         """Test release dry run shows plan without changes."""
         runner = CliRunner()
@@ -1186,6 +1788,26 @@ class TestReleaseCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_release_dry_run_no_push_numbers_steps_consecutively(self) -> None:
+        """Test dry-run plan numbering without push steps has no gaps."""
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                version_dir = Path(tmpdir) / "src" / "klondike_spec_cli"
+                version_dir.mkdir(parents=True)
+                (version_dir / "_version.py").write_text("__version__ = version = '1.0.0'\n")
+
+                result = runner.invoke(app, ["release", "1.1.0", "--dry-run", "--no-push"])
+
+                assert result.exit_code == 0
+                assert "  2. Commit any pending changes" in result.output
+                assert "  3. Create tag v1.1.0" in result.output
+                assert "Push" not in result.output
+            finally:
+                os.chdir(original_cwd)
+
     def test_release_bump_patch(self) -> None:
         """Test release with --bump patch."""
         runner = CliRunner()
@@ -1308,3 +1930,136 @@ class TestReleaseCommand:
                 assert "Invalid bump type" in result.output
             finally:
                 os.chdir(original_cwd)
+
+    def test_release_without_test_runner_fails(self, monkeypatch) -> None:
+        """Test release stops with a clear error when neither uv nor pytest is on PATH."""
+        from klondike_spec_cli.commands import release_cmd
+
+        monkeypatch.setattr(release_cmd.shutil, "which", lambda name: None)
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                version_dir = Path(tmpdir) / "src" / "klondike_spec_cli"
+                version_dir.mkdir(parents=True)
+                (version_dir / "_version.py").write_text("__version__ = version = '1.0.0'\n")
+
+                result = runner.invoke(app, ["release", "1.1.0"])
+
+                assert result.exit_code != 0
+                assert "No test runner found" in result.output
+            finally:
+                os.chdir(original_cwd)
+
+    def test_release_in_process_tests_failure_aborts(self, monkeypatch) -> None:
+        """Test failing in-process tests stop the release before any git changes."""
+        import pytest
+
+        monkeypatch.setattr(pytest, "main", lambda args: 1)
+        runner = CliRunner()
+        with TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                version_dir = Path(tmpdir) / "src" / "klondike_spec_cli"
+                version_dir.mkdir(parents=True)
+                (version_dir / "_version.py").write_text("__version__ = version = '1.0.0'\n")
+
+                result = runner.invoke(app, ["release", "1.1.0", "--in-process-tests"])
+
+                assert result.exit_code != 0
+                assert "Tests must pass before release" in result.output
+            finally:
+                os.chdir(original_cwd)
+
+    def test_release_test_timeout_kills_runner_children(self, monkeypatch) -> None:
+        """Test the test-run timeout fires even if the runner's child holds the pipe open."""
+        import sys
+        import time
+
+        import pytest
+        from pith import PithException
+
+        from klondike_spec_cli.commands import release_cmd
+
+        if not hasattr(os, "killpg"):
+            pytest.skip("process groups are POSIX only")
+
+        monkeypatch.setattr(release_cmd, "_TEST_TIMEOUT", 1)
+        # Fake runner (like 'uv run') that starts a long-lived test process and waits
+        fake_runner = (
+            "import subprocess, sys, time; "
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); "
+            "time.sleep(60)"
+        )
+        started = time.monotonic()
+
+        with pytest.raises(PithException, match="timed out"):
+            release_cmd._run_test_command([sys.executable, "-c", fake_runner])
+
+        assert time.monotonic() - started < 30
+
+    def test_release_test_interrupt_kills_runner_children(self, monkeypatch) -> None:
+        """Test Ctrl+C while streaming test output also stops the runner's children."""
+        import sys
+        import time
+
+        import pytest
+
+        from klondike_spec_cli.commands import release_cmd
+
+        if not hasattr(os, "killpg"):
+            pytest.skip("process groups are POSIX only")
+
+        # Fake runner that reports its long-lived child's pid, then waits
+        fake_runner = (
+            "import subprocess, sys, time; "
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); "
+            "print(child.pid, flush=True); "
+            "time.sleep(60)"
+        )
+        child_pids: list[int] = []
+
+        def interrupted_read(lines, maxlen):
+            child_pids.append(int(next(iter(lines))))
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(release_cmd, "deque", interrupted_read)
+
+        with pytest.raises(KeyboardInterrupt):
+            release_cmd._run_test_command([sys.executable, "-c", fake_runner])
+
+        def is_running(pid: int) -> bool:
+            try:
+                state = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0]
+            except FileNotFoundError:
+                return False
+            return state != "Z"  # an unreaped zombie has already exited
+
+        deadline = time.monotonic() + 10
+        while is_running(child_pids[0]) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not is_running(child_pids[0])
+
+
+class TestVersionFastPath:
+    """Tests for the --version fast path in the console entry point."""
+
+    def test_version_flag_skips_cli_import(self) -> None:
+        """Test --version prints the version without importing the CLI app."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; sys.argv = ['klondike', '--version']\n"
+            "from klondike_spec_cli.__main__ import main; main()\n"
+            "print('klondike_spec_cli.cli' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        from klondike_spec_cli import __version__
+
+        assert result.stdout.splitlines() == [f"klondike {__version__}", "False"]
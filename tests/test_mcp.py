@@ -47,6 +47,24 @@ class TestMcpCommand:
             finally:
                 os.chdir(original_cwd)
 
+    def test_mcp_config_compact(self):
+        """Test that mcp config --compact emits single-line JSON."""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                runner.invoke(app, ["init"])
+
+                result = runner.invoke(app, ["mcp", "config", "--compact"])
+
+                assert result.exit_code == 0
+                json_line = result.output.strip().splitlines()[-1]
+                assert json_line.startswith('{"mcpServers":')
+                assert "klondike" in json.loads(json_line)["mcpServers"]
+            finally:
+                os.chdir(original_cwd)
+
     def test_mcp_config_writes_to_file(self):
         """Test that mcp config can write to a file."""
         runner = CliRunner()
@@ -202,6 +220,39 @@ class TestMcpServerTools:
         assert root == Path(self.tmpdir)
         assert (root / ".klondike").exists()
 
+    def test_validate_artifacts_reports_duplicate_id_once(self, monkeypatch):
+        """Test validate_artifacts lists each duplicated feature ID a single time."""
+        from klondike_spec_cli import mcp_server
+
+        class StubServer:
+            """Collects the registered tool functions instead of serving them."""
+
+            def __init__(self, **kwargs):
+                self.tools = {}
+
+            def tool(self):
+                def register(fn):
+                    self.tools[fn.__name__] = fn
+                    return fn
+
+                return register
+
+        monkeypatch.setattr(mcp_server, "MCP_AVAILABLE", True)
+        monkeypatch.setattr(mcp_server, "FastMCP", StubServer)
+
+        features_path = Path(self.tmpdir) / ".klondike" / "features.json"
+        data = json.loads(features_path.read_text(encoding="utf-8"))
+        for feature in data["features"]:
+            feature["id"] = "F001"
+        features_path.write_text(json.dumps(data), encoding="utf-8")
+
+        result = mcp_server.create_mcp_server().tools["validate_artifacts"]()
+
+        assert result["valid"] is False
+        duplicate_issues = [i for i in result["issues"] if "Duplicate" in i]
+        assert duplicate_issues == ["Duplicate feature IDs: {'F001'}"]
+        assert " ".join(result["issues"]).count("F001") == 1
+
 
 class TestMcpServerToolsWithSdk:
     """Test MCP server tools that require the SDK."""
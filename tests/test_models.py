@@ -213,6 +213,44 @@ class TestFeatureRegistry:
         assert not_started[0].id == "F001"
         assert in_progress[0].id == "F002"
 
+    def test_count_by_status(self) -> None:
+        """Test counting features per status includes empty statuses."""
+        registry = FeatureRegistry(
+            project_name="test-project",
+            version="1.0.0",
+            features=[
+                Feature(
+                    id=f"F00{i}",
+                    description=f"Feature {i}",
+                    category=FeatureCategory.CORE,
+                    priority=1,
+                    acceptance_criteria=["Criterion"],
+                    status=status,
+                )
+                for i, status in enumerate(
+                    [FeatureStatus.VERIFIED, FeatureStatus.VERIFIED, FeatureStatus.BLOCKED], 1
+                )
+            ],
+            metadata=FeatureMetadata(
+                created_at="2025-01-01T00:00:00Z",
+                last_updated="2025-01-01T00:00:00Z",
+                total_features=3,
+                passing_features=2,
+            ),
+        )
+
+        assert registry.count_by_status() == {
+            FeatureStatus.NOT_STARTED: 0,
+            FeatureStatus.IN_PROGRESS: 0,
+            FeatureStatus.BLOCKED: 1,
+            FeatureStatus.VERIFIED: 2,
+        }
+
+        groups = registry.group_by_status()
+        assert [f.id for f in groups[FeatureStatus.VERIFIED]] == ["F001", "F002"]
+        assert [f.id for f in groups[FeatureStatus.BLOCKED]] == ["F003"]
+        assert groups[FeatureStatus.NOT_STARTED] == []
+
     def test_save_and_load(self) -> None:
         """Test saving and loading registry."""
         registry = FeatureRegistry(
@@ -679,3 +717,27 @@ class TestFeatureRegistryPerformance:
         found = registry.get_feature("F011")
         assert found is not None
         assert found.description == "New feature"
+
+    def test_add_features_updates_metadata_and_index(self) -> None:
+        """Test bulk-adding features updates counts and the index."""
+        registry = self._create_large_registry(10)
+        registry.get_feature("F001")
+
+        registry.add_features(
+            [
+                Feature(
+                    id=f"F{n:03d}",
+                    description=f"Bulk feature {n}",
+                    category=FeatureCategory.CORE,
+                    priority=2,
+                    acceptance_criteria=["Test"],
+                )
+                for n in (11, 12)
+            ]
+        )
+
+        assert registry.metadata.total_features == 12
+        assert registry._index_built is False
+        found = registry.get_feature("F012")
+        assert found is not None
+        assert found.description == "Bulk feature 12"
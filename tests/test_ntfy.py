@@ -122,6 +122,24 @@ class TestNtfyClient:
         assert call_args[1]["headers"]["X-Priority"] == "5"
         assert call_args[1]["headers"]["X-Tags"] == "test"
 
+    @pytest.mark.skipif(not REQUESTS_AVAILABLE, reason="requests library not available")
+    @patch("klondike_spec_cli.ntfy.requests")
+    def test_send_uses_patched_requests_module(self, mock_requests, client):
+        """Test the lazily imported requests module can be patched as a whole."""
+        mock_requests.post.return_value.status_code = 200
+
+        assert client._send("Test message") is True
+        mock_requests.post.assert_called_once()
+
+    def test_send_logs_through_module_logger(self, client):
+        """Test debug messages go through the patchable module-level logger."""
+        client.config.channel = None
+
+        with patch("klondike_spec_cli.ntfy.logger") as mock_logger:
+            assert client._send("Test message") is False
+
+        mock_logger.debug.assert_called_once()
+
     @pytest.mark.skipif(not REQUESTS_AVAILABLE, reason="requests library not available")
     @patch("klondike_spec_cli.ntfy.requests.post")
     def test_send_with_token(self, mock_post, config):
@@ -16,6 +16,7 @@ from klondike_spec_cli.templates import (
     get_github_templates_list,
     list_templates,
     read_template,
+    substitute_vars,
 )
 
 
@@ -53,6 +54,18 @@ class TestTemplates:
         assert "default_category: core" in content
         assert "verified_by: coding-agent" in content
 
+    def test_read_template_is_cached(self) -> None:
+        """Test repeated reads of a template reuse the first result."""
+        assert read_template(FEATURES_TEMPLATE) is read_template(FEATURES_TEMPLATE)
+
+    def test_substitute_vars(self) -> None:
+        """Test placeholders are replaced in one pass and unknown ones are kept."""
+        content = "{{PROJECT_NAME}} on {{DATE}} ({{UNKNOWN}})"
+        result = substitute_vars(
+            content, {"{{PROJECT_NAME}}": "{{DATE}}", "{{DATE}}": "2025-01-01"}
+        )
+        assert result == "{{DATE}} on 2025-01-01 ({{UNKNOWN}})"
+
     def test_read_invalid_template(self) -> None:
         """Test reading an invalid template raises error."""
         with pytest.raises(ValueError, match="Unknown template"):